@@ -18,6 +18,11 @@ import urllib.request
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    from .data_utils import read_json
+except ImportError:  # pragma: no cover - script execution fallback
+    from data_utils import read_json
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 OUTPUT_PATH = REPO_ROOT / "backend" / "data" / "catcher_workload.json"
@@ -37,8 +42,7 @@ def cache_is_fresh(path: Path, ttl_hours: float) -> bool:
 def load_players(players_path: Path) -> list[dict]:
     if not players_path.exists():
         return []
-    with players_path.open("r", encoding="utf-8") as handle:
-        payload = json.load(handle)
+    payload = read_json(players_path)
     return payload.get("players", [])
 
 
@@ -55,11 +59,18 @@ def write_workload(output_path: Path, data: dict) -> None:
         json.dump(data, handle, indent=2, sort_keys=True)
 
 
+POSITION_SPLIT_RE = re.compile(r"[/\s,]+")
+
+
 def is_catcher_position(pos: str | None) -> bool:
     if not pos:
         return False
-    tokens = re.split(r"[/\s,]+", str(pos).strip().upper())
-    return "C" in tokens
+    text = str(pos).strip().upper()
+    if text == "C":
+        return True
+    if "C" not in text:
+        return False
+    return "C" in POSITION_SPLIT_RE.split(text)
 
 
 def parse_innings(innings_str: str | None) -> float:
@@ -211,8 +222,7 @@ def load_positions_map(positions_path: Path) -> dict[int, dict[str, str | None]]
     """Load mlb_id-first position mapping file."""
     if not positions_path.exists():
         return {}
-    with positions_path.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
+    data = read_json(positions_path)
     positions: dict[int, dict[str, str | None]] = {}
     if not isinstance(data, dict):
         return positions
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
 import argparse
+import itertools
 import json
-import math
 import sqlite3
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
 from dataclasses import dataclass, replace
 from datetime import date, datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
 from backend.contracts import ContractSchedule, build_contract_schedule
+from backend.data_utils import read_json
 from backend.durability import DurabilityConfig, DurabilityInputs, build_mixture
 from backend.output import PlayerOutput, build_breakdown, emit_outputs, emit_ranked_outputs
-from backend.projections import AgingCurve, SeasonHistory, build_rate_projection, expected_war_path
+from backend.projections import AgingCurve, RateProjection, SeasonHistory, build_rate_projection, expected_war_path
 from backend.service_time import (
     ControlTimeline,
     SERVICE_DAYS_PER_YEAR,
@@ -23,13 +29,22 @@ from backend.service_time import (
     remaining_games_fraction,
     super_two_for_snapshot,
 )
-from backend.simulate import SimulationConfig, SimulationInputs, simulate_tvp
+from backend.simulate import SimulationConfig, SimulationInputs, discount_factors, simulate_tvp
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 VERIFIED_EXTENSIONS_PATH = REPO_ROOT / "backend" / "config" / "verified_extensions.json"
-
-
-@dataclass(frozen=True)
+PITCHER_ROLES = frozenset({"SP", "RP"})
+PROJECTION_ROLES = frozenset({"H", "SP", "RP"})
+CONTRACT_COST_BASES = frozenset({"guaranteed", "aav", "cbt_aav"})
+ZERO_SERVICE_LABELS = frozenset({"0", "0/000", "00/000"})
+MLBAM_ID = attrgetter("mlbam_id")
+PARALLEL_MIN_PLAYERS = 32
+PITCHER_USAGE_DENOM = 180.0
+HITTER_USAGE_DENOM = 600.0
+DEFAULT_USAGE_PRIOR = {"sp": 180.0, "rp": 60.0, "everyday": 600.0, "platoon": 350.0, "bench": 150.0}
+
+
+@dataclass(frozen=True, slots=True)
 class MLBV1Config:
     war_source: str
     price_P0: float
@@ -53,7 +68,8 @@ class MLBV1Config:
     season_window: SeasonWindow
     durability_hit: DurabilityConfig
     durability_pitch: DurabilityConfig
-    sp_prob_by_age: dict[int, float]
+    sp_prob_ages: tuple[int, ...]
+    sp_prob_values: tuple[float, ...]
     contract_cost_basis: str
     contract_deferral_multiplier: float
     contract_overrides: dict[int, dict[str, Any]]
@@ -82,12 +98,26 @@ class MLBV1Config:
     p0_war_min: float
     p0_exclude_relief: bool
     p0_trim_pct: float
-    verified_extension_ids: set[int]
+    verified_extension_ids: frozenset[int]
 
 
 def load_config(path: Path, war_source: str) -> MLBV1Config:
-    with path.open("r") as handle:
-        data = json.load(handle)
+    path = Path(path)
+    try:
+        verified_mtime_ns = VERIFIED_EXTENSIONS_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        verified_mtime_ns = None
+    return _load_config_cached(str(path.resolve()), path.stat().st_mtime_ns, war_source, verified_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(
+    path: str,
+    mtime_ns: int,
+    war_source: str,
+    verified_mtime_ns: int | None,
+) -> MLBV1Config:
+    data = read_json(Path(path))
     cfg = data.get("mlb_v1") or {}
     war_sources = cfg.get("war_sources", {})
     if war_source not in war_sources:
@@ -114,6 +144,14 @@ def load_config(path: Path, war_source: str) -> MLBV1Config:
             workload_spike_penalty=float(payload.get("workload_spike_penalty", 0.03)),
         )
 
+    def by_role(payload: dict[str, Any], pitcher_default: float, hitter_default: float) -> dict[str, float]:
+        values = {k: float(v) for k, v in payload.items()}
+        pitcher_fallback = values.get("SP", pitcher_default)
+        for role in PITCHER_ROLES:
+            values.setdefault(role, pitcher_fallback)
+        values.setdefault("H", hitter_default)
+        return values
+
     season_start = cfg.get("season_start", "04-01")
     season_end = cfg.get("season_end", "10-01")
 
@@ -126,20 +164,24 @@ def load_config(path: Path, war_source: str) -> MLBV1Config:
 
     p0_cfg = cfg.get("p0_calibration", {})
     verified_ids: set[int] = set()
-    if VERIFIED_EXTENSIONS_PATH.exists():
-        try:
-            data = json.loads(VERIFIED_EXTENSIONS_PATH.read_text())
-            if isinstance(data, dict):
-                raw_ids = data.get("ids", [])
-            else:
-                raw_ids = data
-            for item in raw_ids or []:
-                try:
-                    verified_ids.add(int(item))
-                except (TypeError, ValueError):
-                    continue
-        except json.JSONDecodeError:
-            verified_ids = set()
+    try:
+        data = read_json(VERIFIED_EXTENSIONS_PATH)
+    except (FileNotFoundError, json.JSONDecodeError):
+        data = None
+    if data is not None:
+        if isinstance(data, dict):
+            raw_ids = data.get("ids", [])
+        else:
+            raw_ids = data
+        for item in raw_ids or []:
+            try:
+                verified_ids.add(int(item))
+            except (TypeError, ValueError):
+                continue
+
+    sp_prob_items = sorted(
+        {int(k): float(v) for k, v in cfg.get("role_prior", {}).get("sp_prob_by_age", {}).items()}.items()
+    )
 
     year_shock_cfg = cfg.get("year_shock_sd", 0.35)
     if isinstance(year_shock_cfg, dict):
@@ -158,10 +200,10 @@ def load_config(path: Path, war_source: str) -> MLBV1Config:
         year_shock_sd_hit=hit_shock,
         year_shock_sd_pitch=pitch_shock,
         talent_sd=float(cfg.get("talent_sd", 0.5)),
-        k_rate={k: float(v) for k, v in cfg.get("k_rate", {}).items()},
-        k_usage={k: float(v) for k, v in cfg.get("k_usage", {}).items()},
-        rate_prior={k: float(v) for k, v in cfg.get("rate_prior", {}).items()},
-        usage_prior={k: float(v) for k, v in cfg.get("usage_prior", {}).items()},
+        k_rate=by_role(cfg.get("k_rate", {}), 180.0, 600.0),
+        k_usage=by_role(cfg.get("k_usage", {}), 180.0, 600.0),
+        rate_prior=by_role(cfg.get("rate_prior", {}), 2.5, 2.0),
+        usage_prior={**DEFAULT_USAGE_PRIOR, **{k: float(v) for k, v in cfg.get("usage_prior", {}).items()}},
         aging_curve_hit=curve_from_dict(cfg.get("aging_curve", {}).get("H", {})),
         aging_curve_pitch=curve_from_dict(cfg.get("aging_curve", {}).get("P", {})),
         min_salary_m=float(cfg.get("min_salary_m", 0.8)),
@@ -175,7 +217,8 @@ def load_config(path: Path, war_source: str) -> MLBV1Config:
         ),
         durability_hit=durability_from_dict(cfg.get("durability", {}).get("hitters", {})),
         durability_pitch=durability_from_dict(cfg.get("durability", {}).get("pitchers", {})),
-        sp_prob_by_age={int(k): float(v) for k, v in cfg.get("role_prior", {}).get("sp_prob_by_age", {}).items()},
+        sp_prob_ages=tuple(age for age, _ in sp_prob_items),
+        sp_prob_values=tuple(value for _, value in sp_prob_items),
         contract_cost_basis=str(cfg.get("contract_cost_basis", "yearly")),
         contract_deferral_multiplier=float(cfg.get("contract_deferral_multiplier", 1.3)),
         contract_overrides={
@@ -208,42 +251,50 @@ def load_config(path: Path, war_source: str) -> MLBV1Config:
         p0_war_min=float(p0_cfg.get("war_min", 1.0)),
         p0_exclude_relief=bool(p0_cfg.get("exclude_relief", True)),
         p0_trim_pct=float(p0_cfg.get("trim_pct", 0.1)),
-        verified_extension_ids=verified_ids,
+        verified_extension_ids=frozenset(verified_ids),
     )
 
 
-def load_service_time(db_path: Path) -> dict[int, ServiceTimeRecord]:
+def open_stats_db(db_path: Path) -> sqlite3.Connection | None:
     if not db_path.exists():
-        return {}
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
+        return None
+    conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -200000")
+    conn.execute("PRAGMA mmap_size = 268435456")
+    return conn
+
+
+def load_service_time(conn: sqlite3.Connection) -> dict[int, ServiceTimeRecord]:
     try:
-        cur.execute(
+        rows = conn.execute(
             "SELECT mlbam_id, service_time_years, service_time_days, service_time_label "
-            "FROM service_time_bref"
+            "FROM service_time_bref WHERE mlbam_id IS NOT NULL"
         )
     except sqlite3.Error:
-        conn.close()
         return {}
-    records = {}
-    for mlbam_id, years, days, label in cur.fetchall():
-        if mlbam_id is None:
-            continue
-        records[int(mlbam_id)] = ServiceTimeRecord(
+    return {
+        int(mlbam_id): ServiceTimeRecord(
             mlbam_id=int(mlbam_id),
             service_time_years=int(years or 0),
             service_time_days=int(days or 0),
             service_time_label=label,
         )
-    conn.close()
-    return records
+        for mlbam_id, years, days, label in rows
+    }
 
 
 def load_positions_map(path: Path) -> dict[int, str]:
-    if not path.exists():
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
         return {}
-    with path.open() as handle:
-        data = json.load(handle)
+    return _load_positions_cached(str(path.resolve()), mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _load_positions_cached(path: str, mtime_ns: int) -> dict[int, str]:
+    data = read_json(Path(path))
     positions: dict[int, str] = {}
     for key, value in data.items():
         try:
@@ -260,33 +311,38 @@ def load_positions_map(path: Path) -> dict[int, str]:
 
 
 def load_war_data(path: Path) -> dict[int, dict[str, Any]]:
-    if not path.exists():
-        raise FileNotFoundError(f"Missing WAR data: {path}")
-    with path.open() as handle:
-        data = json.load(handle)
+    try:
+        data = read_json(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Missing WAR data: {path}") from None
     players = data.get("players", [])
     return {int(p["player_id"]): p for p in players if p.get("player_id") is not None}
 
 
 def load_contracts(path: Path) -> list[dict[str, Any]]:
-    if not path.exists():
-        raise FileNotFoundError(f"Missing contract data: {path}")
-    with path.open() as handle:
-        data = json.load(handle)
+    try:
+        data = read_json(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Missing contract data: {path}") from None
     return data.get("players", [])
 
 
-def load_usage_stats(db_path: Path, seasons: list[int]) -> dict[int, dict[int, dict[str, float]]]:
+def stats_table_columns(conn: sqlite3.Connection) -> tuple[set[str], set[str]]:
+    columns: dict[str, set[str]] = {"bat": set(), "pit": set()}
+    rows = conn.execute(
+        "SELECT 'bat', name FROM pragma_table_info('batting_stats') "
+        "UNION ALL SELECT 'pit', name FROM pragma_table_info('pitching_stats')"
+    )
+    for kind, name in rows:
+        columns[kind].add(name)
+    return columns["bat"], columns["pit"]
+
+
+def load_usage_stats(conn: sqlite3.Connection, seasons: list[int]) -> dict[int, dict[int, dict[str, float]]]:
     usage: dict[int, dict[int, dict[str, float]]] = {}
-    if not db_path.exists():
-        return usage
-    conn = sqlite3.connect(db_path)
     cur = conn.cursor()
 
-    cur.execute("PRAGMA table_info(batting_stats)")
-    bat_cols = {row[1] for row in cur.fetchall()}
-    cur.execute("PRAGMA table_info(pitching_stats)")
-    pit_cols = {row[1] for row in cur.fetchall()}
+    bat_cols, pit_cols = stats_table_columns(conn)
 
     has_ops_plus = "ops_plus" in bat_cols
     has_ab = "ab" in bat_cols
@@ -300,42 +356,85 @@ def load_usage_stats(db_path: Path, seasons: list[int]) -> dict[int, dict[int, d
     has_so = "so" in pit_cols
     has_er = "er" in pit_cols
 
-    for season in seasons:
-        bat_fields = ["mlbid", "pa"]
-        if has_ab:
-            bat_fields.append("ab")
-        if has_obp:
-            bat_fields.append("obp")
-        if has_slg:
-            bat_fields.append("slg")
-        if has_ops_plus:
-            bat_fields.append("ops_plus")
+    bat_fields = ["mlbid", "pa"]
+    if has_ab:
+        bat_fields.append("ab")
+    if has_obp:
+        bat_fields.append("obp")
+    if has_slg:
+        bat_fields.append("slg")
+    if has_ops_plus:
+        bat_fields.append("ops_plus")
+    bat_idx = {field: idx for idx, field in enumerate(bat_fields)}
+
+    pit_fields = ["mlbid", "ip", "g", "gs"]
+    if has_fip:
+        pit_fields.append("fip")
+    if has_hr:
+        pit_fields.append("hr")
+    if has_bb:
+        pit_fields.append("bb")
+    if has_hbp:
+        pit_fields.append("hbp")
+    if has_so:
+        pit_fields.append("so")
+    if has_er:
+        pit_fields.append("er")
+    pit_idx = {field: idx for idx, field in enumerate(pit_fields)}
+
+    season_params = ", ".join("?" for _ in seasons)
+    bat_rows_by_season: dict[int, list[tuple]] = {}
+    cur.execute(
+        f"SELECT {', '.join(bat_fields)}, season FROM batting_stats "
+        f"WHERE season IN ({season_params}) AND lev LIKE 'Maj-%'",
+        seasons,
+    )
+    for row in cur.fetchall():
+        bat_rows_by_season.setdefault(row[-1], []).append(row)
+    pit_rows_by_season: dict[int, list[tuple]] = {}
+    cur.execute(
+        f"SELECT {', '.join(pit_fields)}, season FROM pitching_stats "
+        f"WHERE season IN ({season_params}) AND lev LIKE 'Maj-%'",
+        seasons,
+    )
+    for row in cur.fetchall():
+        pit_rows_by_season.setdefault(row[-1], []).append(row)
+
+    bat_totals: dict[int, tuple[float, float, float, float]] = {}
+    if has_obp and has_slg and has_ab:
+        cur.execute(
+            "SELECT season, SUM(pa), SUM(ab), SUM(obp * COALESCE(pa, 0)), SUM(slg * COALESCE(ab, 0)) "
+            f"FROM batting_stats WHERE season IN ({season_params}) AND lev LIKE 'Maj-%' GROUP BY season",
+            seasons,
+        )
+        bat_totals = {row[0]: tuple((value or 0.0) for value in row[1:]) for row in cur.fetchall()}
+    fip_component_totals: dict[int, tuple[float, float, float, float, float, float]] = {}
+    fip_totals: dict[int, tuple[float, float]] = {}
+    if (not has_fip) and has_hr and has_bb and has_hbp and has_so and has_er:
+        cur.execute(
+            "SELECT season, SUM(ip), SUM(hr), SUM(bb), SUM(hbp), SUM(so), SUM(er) "
+            f"FROM pitching_stats WHERE season IN ({season_params}) AND lev LIKE 'Maj-%' GROUP BY season",
+            seasons,
+        )
+        fip_component_totals = {row[0]: tuple((value or 0.0) for value in row[1:]) for row in cur.fetchall()}
+    elif has_fip:
         cur.execute(
-            f"SELECT {', '.join(bat_fields)} FROM batting_stats WHERE season = ? AND lev LIKE 'Maj-%'",
-            (season,),
+            "SELECT season, SUM(ip), SUM(COALESCE(fip, 0.0) * COALESCE(ip, 0.0)) "
+            f"FROM pitching_stats WHERE season IN ({season_params}) AND lev LIKE 'Maj-%' GROUP BY season",
+            seasons,
         )
-        bat_rows = cur.fetchall()
-        bat_idx = {field: idx for idx, field in enumerate(bat_fields)}
+        fip_totals = {row[0]: tuple((value or 0.0) for value in row[1:]) for row in cur.fetchall()}
+
+    for season in seasons:
+        bat_rows = bat_rows_by_season.get(season, [])
 
         lg_obp = None
         lg_slg = None
-        if has_obp and has_slg and has_ab:
-            total_pa = sum((row[bat_idx["pa"]] or 0.0) for row in bat_rows)
-            total_ab = sum((row[bat_idx["ab"]] or 0.0) for row in bat_rows)
+        if season in bat_totals:
+            total_pa, total_ab, obp_sum, slg_sum = bat_totals[season]
             if total_pa > 0 and total_ab > 0:
-                obp_sum = 0.0
-                slg_sum = 0.0
-                for row in bat_rows:
-                    pa = row[bat_idx["pa"]] or 0.0
-                    ab = row[bat_idx["ab"]] or 0.0
-                    obp = row[bat_idx["obp"]] if has_obp else None
-                    slg = row[bat_idx["slg"]] if has_slg else None
-                    if obp is not None:
-                        obp_sum += (obp or 0.0) * pa
-                    if slg is not None:
-                        slg_sum += (slg or 0.0) * ab
-                lg_obp = obp_sum / total_pa if total_pa > 0 else None
-                lg_slg = slg_sum / total_ab if total_ab > 0 else None
+                lg_obp = obp_sum / total_pa
+                lg_slg = slg_sum / total_ab
 
         for row in bat_rows:
             mlbid = row[bat_idx["mlbid"]]
@@ -361,45 +460,20 @@ def load_usage_stats(db_path: Path, seasons: list[int]) -> dict[int, dict[int, d
             if ops_plus is not None:
                 entry["ops_plus"] = float(ops_plus)
 
-        pit_fields = ["mlbid", "ip", "g", "gs"]
-        if has_fip:
-            pit_fields.append("fip")
-        if has_hr:
-            pit_fields.append("hr")
-        if has_bb:
-            pit_fields.append("bb")
-        if has_hbp:
-            pit_fields.append("hbp")
-        if has_so:
-            pit_fields.append("so")
-        if has_er:
-            pit_fields.append("er")
-        cur.execute(
-            f"SELECT {', '.join(pit_fields)} FROM pitching_stats WHERE season = ? AND lev LIKE 'Maj-%'",
-            (season,),
-        )
-        pit_rows = cur.fetchall()
-        pit_idx = {field: idx for idx, field in enumerate(pit_fields)}
+        pit_rows = pit_rows_by_season.get(season, [])
 
         lg_fip = None
         fip_const = None
-        if (not has_fip) and has_hr and has_bb and has_hbp and has_so and has_er:
-            lg_ip = sum((row[pit_idx["ip"]] or 0.0) for row in pit_rows)
+        if season in fip_component_totals:
+            lg_ip, hr_sum, bb_sum, hbp_sum, so_sum, er_sum = fip_component_totals[season]
             if lg_ip > 0:
-                hr_sum = sum((row[pit_idx["hr"]] or 0.0) for row in pit_rows) if has_hr else 0.0
-                bb_sum = sum((row[pit_idx["bb"]] or 0.0) for row in pit_rows) if has_bb else 0.0
-                hbp_sum = sum((row[pit_idx["hbp"]] or 0.0) for row in pit_rows) if has_hbp else 0.0
-                so_sum = sum((row[pit_idx["so"]] or 0.0) for row in pit_rows) if has_so else 0.0
-                er_sum = sum((row[pit_idx["er"]] or 0.0) for row in pit_rows) if has_er else 0.0
-                lg_era = (9.0 * er_sum / lg_ip) if lg_ip > 0 else 0.0
+                lg_era = 9.0 * er_sum / lg_ip
                 fip_const = lg_era - ((13 * hr_sum + 3 * (bb_sum + hbp_sum) - 2 * so_sum) / lg_ip)
                 lg_fip = lg_era
-        elif has_fip:
-            lg_ip = sum((row[pit_idx["ip"]] or 0.0) for row in pit_rows)
+        elif season in fip_totals:
+            lg_ip, fip_sum = fip_totals[season]
             if lg_ip > 0:
-                fip_index = pit_idx["fip"]
-                fip_sum = sum((row[fip_index] or 0.0) * (row[pit_idx["ip"]] or 0.0) for row in pit_rows)
-                lg_fip = fip_sum / lg_ip if lg_ip > 0 else None
+                lg_fip = fip_sum / lg_ip
 
         for row in pit_rows:
             mlbid = row[pit_idx["mlbid"]]
@@ -425,42 +499,64 @@ def load_usage_stats(db_path: Path, seasons: list[int]) -> dict[int, dict[int, d
             if lg_fip is not None:
                 entry["lg_fip"] = float(lg_fip)
 
-    conn.close()
     return usage
 
 
 
 
-def coverage_ok(db_path: Path, expected_seasons: list[int]) -> bool:
-    if not db_path.exists():
-        return False
-    conn = sqlite3.connect(db_path)
+def coverage_ok(conn: sqlite3.Connection, expected_seasons: list[int]) -> bool:
     cur = conn.cursor()
+    seasons: dict[str, set[int]] = {"bat": set(), "pit": set()}
     try:
-        cur.execute("SELECT DISTINCT season FROM batting_stats")
-        batting_seasons = {row[0] for row in cur.fetchall() if row[0] is not None}
-        cur.execute("SELECT DISTINCT season FROM pitching_stats")
-        pitching_seasons = {row[0] for row in cur.fetchall() if row[0] is not None}
+        cur.execute(
+            "SELECT DISTINCT 'bat', season FROM batting_stats "
+            "UNION ALL SELECT DISTINCT 'pit', season FROM pitching_stats"
+        )
+        for kind, season in cur:
+            if season is not None:
+                seasons[kind].add(season)
     except sqlite3.Error:
-        conn.close()
         return False
-    conn.close()
     expected = set(expected_seasons)
-    return expected.issubset(batting_seasons) and expected.issubset(pitching_seasons)
+    return expected.issubset(seasons["bat"]) and expected.issubset(seasons["pit"])
+
+
+@dataclass(frozen=True, slots=True)
+class UsageSummary:
+    pa: float
+    ip: float
+    g: float
+    gs: float
+
+    @property
+    def gs_share(self) -> float:
+        return (self.gs / self.g) if self.g else 0.0
+
+
+EMPTY_USAGE = UsageSummary(pa=0.0, ip=0.0, g=0.0, gs=0.0)
+
+
+def summarize_usage(usage: dict[int, dict[str, float]]) -> UsageSummary:
+    pa = ip = g = gs = 0.0
+    for season in usage.values():
+        pa += season.get("pa", 0.0)
+        ip += season.get("ip", 0.0)
+        g += season.get("g", 0.0)
+        gs += season.get("gs", 0.0)
+    return UsageSummary(pa=pa, ip=ip, g=g, gs=gs)
 
 
 def total_usage(usage: dict[int, dict[str, float]]) -> tuple[float, float]:
-    pa_total = sum(v.get("pa", 0.0) for v in usage.values())
-    ip_total = sum(v.get("ip", 0.0) for v in usage.values())
-    return pa_total, ip_total
+    summary = summarize_usage(usage)
+    return summary.pa, summary.ip
 
 
 def usage_window_seasons_present(usage: dict[int, dict[str, float]]) -> int:
-    return sum(
-        1
-        for season in usage.values()
-        if (season.get("pa", 0.0) > 0) or (season.get("ip", 0.0) > 0)
-    )
+    count = 0
+    for season in usage.values():
+        if (season.get("pa", 0.0) > 0) or (season.get("ip", 0.0) > 0):
+            count += 1
+    return count
 
 
 def risk_adjusted_value(mean: float, std: float, risk_lambda: float) -> float:
@@ -499,20 +595,14 @@ def season_metric_weight(season: int, highlight_season: int, boost: float) -> fl
 
 
 def load_metric_history(
-    db_path: Path,
+    conn: sqlite3.Connection,
     highlight_season: int,
     config: MLBV1Config,
 ) -> dict[int, dict[str, float]]:
     metrics: dict[int, dict[str, float]] = {}
-    if not db_path.exists():
-        return metrics
-    conn = sqlite3.connect(db_path)
     cur = conn.cursor()
 
-    cur.execute("PRAGMA table_info(batting_stats)")
-    bat_cols = {row[1] for row in cur.fetchall()}
-    cur.execute("PRAGMA table_info(pitching_stats)")
-    pit_cols = {row[1] for row in cur.fetchall()}
+    bat_cols, pit_cols = stats_table_columns(conn)
 
     has_ops_plus = "ops_plus" in bat_cols
     has_obp = "obp" in bat_cols
@@ -525,7 +615,7 @@ def load_metric_history(
             "SUM(COALESCE(obp,0) * COALESCE(pa,0)), SUM(COALESCE(slg,0) * COALESCE(ab,0)) "
             "FROM batting_stats WHERE lev LIKE 'Maj-%' GROUP BY season"
         )
-        for season, total_pa, total_ab, obp_sum, slg_sum in cur.fetchall():
+        for season, total_pa, total_ab, obp_sum, slg_sum in cur:
             if not season or not total_pa or not total_ab:
                 continue
             lg_obp = obp_sum / total_pa if total_pa else None
@@ -543,9 +633,8 @@ def load_metric_history(
     cur.execute(
         f"SELECT {', '.join(bat_fields)} FROM batting_stats WHERE lev LIKE 'Maj-%'"
     )
-    bat_rows = cur.fetchall()
     bat_idx = {field: idx for idx, field in enumerate(bat_fields)}
-    for row in bat_rows:
+    for row in cur:
         mlbid = row[bat_idx["mlbid"]]
         if mlbid is None:
             continue
@@ -588,7 +677,7 @@ def load_metric_history(
             "SUM(COALESCE(hbp,0)), SUM(COALESCE(so,0)), SUM(COALESCE(er,0)) "
             "FROM pitching_stats WHERE lev LIKE 'Maj-%' GROUP BY season"
         )
-        for season, ip, hr, bb, hbp, so, er in cur.fetchall():
+        for season, ip, hr, bb, hbp, so, er in cur:
             if not season or not ip:
                 continue
             lg_era = (9.0 * er / ip) if ip else None
@@ -612,9 +701,8 @@ def load_metric_history(
     cur.execute(
         f"SELECT {', '.join(pit_fields)} FROM pitching_stats WHERE lev LIKE 'Maj-%'"
     )
-    pit_rows = cur.fetchall()
     pit_idx = {field: idx for idx, field in enumerate(pit_fields)}
-    for row in pit_rows:
+    for row in cur:
         mlbid = row[pit_idx["mlbid"]]
         if mlbid is None:
             continue
@@ -657,7 +745,6 @@ def load_metric_history(
             if entry.get("lg_fip_weighted_sum") is not None:
                 entry["lg_fip_weighted"] = entry.get("lg_fip_weighted_sum", 0.0) / fip_weight
 
-    conn.close()
     return metrics
 
 
@@ -669,7 +756,7 @@ def build_status_t(
     year_types = [year.year_type for year in timeline.years]
     for idx, year in enumerate(schedule.years):
         basis = year.basis
-        if basis in {"guaranteed", "aav", "cbt_aav"}:
+        if basis in CONTRACT_COST_BASES:
             statuses.append("contract")
             continue
         if basis == "option":
@@ -692,7 +779,7 @@ def backloaded_contract(schedule: ContractSchedule, threshold: float = 1.25) ->
     costs = [
         year.cost_m
         for year in schedule.years
-        if year.basis in {"guaranteed", "aav", "cbt_aav", "option"}
+        if year.basis in CONTRACT_COST_BASES or year.basis == "option"
     ]
     if len(costs) < 6:
         return False
@@ -706,31 +793,34 @@ def backloaded_contract(schedule: ContractSchedule, threshold: float = 1.25) ->
 def late_negative_surplus_years(breakdown: list[dict[str, Any]], tail_years: int = 3) -> int:
     if not breakdown:
         return 0
-    tail = breakdown[-tail_years:]
-    return sum(1 for row in tail if row.get("surplus", 0.0) < 0.0)
+    count = 0
+    for row in breakdown[-tail_years:]:
+        if row.get("surplus", 0.0) < 0.0:
+            count += 1
+    return count
 
 
 def seasons_with_usage(history: list[SeasonHistory]) -> int:
     return sum(1 for entry in history if entry.usage > 0)
 
 
-def is_player_eligible(service_record: ServiceTimeRecord | None, usage: dict[int, dict[str, float]]) -> bool:
+def is_player_eligible(service_record: ServiceTimeRecord | None, usage: UsageSummary) -> bool:
     service_days = service_record.total_service_days if service_record else 0
-    pa_total, ip_total = total_usage(usage)
-    return service_days > 0 or (pa_total + ip_total) > 0
+    return service_days > 0 or (usage.pa + usage.ip) > 0
 
 
 def leaderboard_eligible(
     role: str,
-    usage: dict[int, dict[str, float]],
+    usage: UsageSummary,
     service_record: ServiceTimeRecord | None,
     config: MLBV1Config,
 ) -> bool:
     service_days = service_record.total_service_days if service_record else 0
     if service_days >= config.leaderboard_min_service_days:
         return True
-    pa_total, ip_total = total_usage(usage)
-    if role in {"SP", "RP"}:
+    pa_total = usage.pa
+    ip_total = usage.ip
+    if role in PITCHER_ROLES:
         return ip_total >= config.leaderboard_min_ip
     if role == "H":
         return pa_total >= config.leaderboard_min_pa
@@ -739,42 +829,54 @@ def leaderboard_eligible(
     return False
 
 
-def sp_prob_by_age(age: int, mapping: dict[int, float]) -> float:
-    if not mapping:
+def leaderboard_partition(
+    ranked: list[PlayerOutput],
+    include_small_sample: bool,
+) -> tuple[list[PlayerOutput], list[PlayerOutput]]:
+    pool: list[PlayerOutput] = []
+    eligible: list[PlayerOutput] = []
+    for output in ranked:
+        flags = output.flags
+        if not flags.get("leaderboard_eligible", True):
+            continue
+        pool.append(output)
+        if include_small_sample or not flags.get("small_sample", False):
+            eligible.append(output)
+    return pool, eligible
+
+
+def zero_service_count(outputs: list[PlayerOutput]) -> int:
+    count = 0
+    for output in outputs:
+        if output.service_time is None or output.service_time in ZERO_SERVICE_LABELS:
+            count += 1
+    return count
+
+
+def sp_prob_by_age(age: int, ages: tuple[int, ...], values: tuple[float, ...]) -> float:
+    if not ages:
         return 0.5
-    candidates = sorted(mapping.items())
-    chosen = candidates[0][1]
-    for age_key, value in candidates:
-        if age >= age_key:
-            chosen = value
-        else:
-            break
+    chosen = values[max(0, bisect_right(ages, age) - 1)]
     return max(0.0, min(1.0, chosen))
 
 
-def determine_role(usage: dict[int, dict[str, float]], config: MLBV1Config) -> tuple[str, float | None]:
-    pa = sum(v.get("pa", 0.0) for v in usage.values())
-    ip = sum(v.get("ip", 0.0) for v in usage.values())
+def determine_role(usage: UsageSummary, config: MLBV1Config) -> tuple[str, float | None]:
+    pa = usage.pa
+    ip = usage.ip
     if ip >= config.ip_role_min and pa <= config.pa_trivial_max:
-        g = sum(v.get("g", 0.0) for v in usage.values())
-        gs = sum(v.get("gs", 0.0) for v in usage.values())
-        gs_share = (gs / g) if g else 0.0
+        gs_share = usage.gs_share
         role = "SP" if gs_share >= 0.5 else "RP"
         return role, gs_share
     if ip >= config.ip_hyb_min and pa >= config.pa_hyb_min:
         return "HYB", None
     if ip > 0 and pa == 0:
-        g = sum(v.get("g", 0.0) for v in usage.values())
-        gs = sum(v.get("gs", 0.0) for v in usage.values())
-        gs_share = (gs / g) if g else 0.0
+        gs_share = usage.gs_share
         role = "SP" if gs_share >= 0.5 else "RP"
         return role, gs_share
     if pa > 0 and ip == 0:
         return "H", None
     if ip >= config.ip_hyb_min:
-        g = sum(v.get("g", 0.0) for v in usage.values())
-        gs = sum(v.get("gs", 0.0) for v in usage.values())
-        gs_share = (gs / g) if g else 0.0
+        gs_share = usage.gs_share
         role = "SP" if gs_share >= 0.5 else "RP"
         return role, gs_share
     if pa >= config.pa_hyb_min:
@@ -784,16 +886,16 @@ def determine_role(usage: dict[int, dict[str, float]], config: MLBV1Config) -> t
 
 def resolve_projection_role(
     role_code: str,
-    usage: dict[int, dict[str, float]],
+    usage: UsageSummary,
     gs_share: float | None,
     config: MLBV1Config,
 ) -> str:
     if role_code != "HYB":
         return role_code
     resolved, _ = determine_role(usage, config)
-    if resolved in {"SP", "RP", "H"}:
+    if resolved in PROJECTION_ROLES:
         return resolved
-    return config.hybrid_default_role if config.hybrid_default_role in {"H", "SP", "RP"} else "H"
+    return config.hybrid_default_role if config.hybrid_default_role in PROJECTION_ROLES else "H"
 
 
 def should_use_aav_for_deferrals(
@@ -820,10 +922,12 @@ def apply_contract_overrides(
     snapshot_year: int,
     config: MLBV1Config,
 ) -> tuple[dict[str, Any], str | None]:
-    contract_copy = dict(contract)
     basis_override: str | None = None
-    override = config.contract_overrides.get(mlbam_id)
+    override = config.contract_overrides.get(mlbam_id) if config.contract_overrides else None
+    if not override and config.contract_cost_basis != "aav_for_deferrals":
+        return contract, basis_override
     if override:
+        contract_copy = dict(contract)
         basis_override = str(override.get("basis") or "aav_override")
         term_start = override.get("term_start")
         term_years = override.get("term_years")
@@ -856,45 +960,49 @@ def apply_contract_overrides(
         contract_copy["cost_basis_override"] = basis_override
         return contract_copy, basis_override
 
-    if config.contract_cost_basis == "aav_for_deferrals" and should_use_aav_for_deferrals(
-        contract_copy,
+    if should_use_aav_for_deferrals(
+        contract,
         snapshot_year,
         config.contract_deferral_multiplier,
     ):
-        aav = contract_copy.get("aav_m")
-        years = contract_copy.get("years_remaining") or contract_copy.get("guaranteed_years_remaining")
+        aav = contract.get("aav_m")
+        years = contract.get("years_remaining") or contract.get("guaranteed_years_remaining")
         if aav is not None and years:
             try:
                 years = int(years)
                 aav = float(aav)
-                contract_copy["contract_years"] = [
-                    {"season": snapshot_year + i, "salary_m": aav, "is_guaranteed": True}
-                    for i in range(years)
-                ]
-                basis_override = "aav"
-                contract_copy["cost_basis_override"] = basis_override
             except (TypeError, ValueError):
-                pass
-    return contract_copy, basis_override
+                return contract, basis_override
+            basis_override = "aav"
+            contract_copy = dict(contract)
+            contract_copy["contract_years"] = [
+                {"season": snapshot_year + i, "salary_m": aav, "is_guaranteed": True}
+                for i in range(years)
+            ]
+            contract_copy["cost_basis_override"] = basis_override
+            return contract_copy, basis_override
+    return contract, basis_override
 
 
 def usage_prior_for_player(
     role: str,
-    usage: dict[int, dict[str, float]],
+    usage: UsageSummary,
     config: MLBV1Config,
 ) -> float:
-    pa_total, ip_total = total_usage(usage)
-    if role in {"SP", "RP"}:
+    pa_total = usage.pa
+    ip_total = usage.ip
+    priors = config.usage_prior
+    if role in PITCHER_ROLES:
         if ip_total < config.small_sample_ip:
-            return config.usage_prior.get("rp", 60.0)
-        return config.usage_prior.get("sp", 180.0) if role == "SP" else config.usage_prior.get("rp", 60.0)
+            return priors["rp"]
+        return priors["sp"] if role == "SP" else priors["rp"]
     if pa_total < config.small_sample_pa:
-        return config.usage_prior.get("bench", 150.0)
+        return priors["bench"]
     if pa_total >= 500:
-        return config.usage_prior.get("everyday", 600.0)
+        return priors["everyday"]
     if pa_total >= 250:
-        return config.usage_prior.get("platoon", 350.0)
-    return config.usage_prior.get("bench", 150.0)
+        return priors["platoon"]
+    return priors["bench"]
 
 
 def contract_source_label(contract: dict[str, Any], verified: bool, override: bool) -> str | None:
@@ -936,15 +1044,23 @@ def is_prospect_like(
     return seasons_present < 2 or low_usage
 
 
-def build_price_curve(config: MLBV1Config, horizon: int) -> list[float]:
+@lru_cache(maxsize=32)
+def price_curve(price_P0: float, growth: float, horizon: int) -> tuple[float, ...]:
+    return tuple(price_P0 * ((1.0 + growth) ** t) for t in range(horizon))
+
+
+def build_price_curve(config: MLBV1Config, horizon: int) -> tuple[float, ...]:
     # TODO: support P0_by_year mapping in config for WAR source calibration.
-    return [config.price_P0 * ((1.0 + config.price_growth) ** t) for t in range(horizon)]
+    return price_curve(config.price_P0, config.price_growth, horizon)
 
 
 def _median(values: list[float]) -> float:
-    if not values:
+    return _median_sorted(sorted(values))
+
+
+def _median_sorted(values_sorted: list[float]) -> float:
+    if not values_sorted:
         return 0.0
-    values_sorted = sorted(values)
     n = len(values_sorted)
     mid = n // 2
     if n % 2 == 1:
@@ -1012,11 +1128,14 @@ def resolve_market_aav(
             return float(total) / years
         except (TypeError, ValueError, ZeroDivisionError):
             pass
-    salaries = [
-        y.get("salary_m")
-        for y in (contract.get("contract_years") or [])
-        if y.get("salary_m") is not None and (y.get("is_guaranteed") is True or y.get("is_guaranteed") is None)
-    ]
+    salaries = []
+    for y in contract.get("contract_years") or []:
+        salary = y.get("salary_m")
+        if salary is None:
+            continue
+        is_guaranteed = y.get("is_guaranteed")
+        if is_guaranteed is True or is_guaranteed is None:
+            salaries.append(salary)
     if salaries:
         return sum(float(s) for s in salaries) / len(salaries)
     if (
@@ -1031,58 +1150,66 @@ def resolve_market_aav(
     return None
 
 
-def projected_war_next_year(
+@lru_cache(maxsize=None)
+def history_window(snapshot_year: int) -> tuple[tuple[int, str], ...]:
+    return tuple((season, f"war_{season}") for season in range(snapshot_year - 3, snapshot_year))
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerProjection:
+    role: str
+    is_pitcher: bool
+    history: list[SeasonHistory]
+    usage: UsageSummary
+    denom: float
+    aging: AgingCurve
+    projection: RateProjection
+
+
+def project_player(
     player: dict[str, Any],
     config: MLBV1Config,
     snapshot_year: int,
-) -> tuple[str, float] | None:
-    age = player.get("age")
-    if age is None:
-        return None
-    age = int(age)
+) -> PlayerProjection:
     role_code = player.get("role")
     usage = player.get("usage", {})
     war_entry = player.get("war", {})
     gs_share = player.get("gs_share")
-    projection_role = resolve_projection_role(role_code, usage, gs_share, config)
+    usage_summary = summarize_usage(usage)
+    projection_role = resolve_projection_role(role_code, usage_summary, gs_share, config)
+    is_pitcher = projection_role in PITCHER_ROLES
 
+    usage_key = "ip" if is_pitcher else "pa"
     history: list[SeasonHistory] = []
-    for season in [snapshot_year - 3, snapshot_year - 2, snapshot_year - 1]:
-        war_val = war_entry.get(f"war_{season}")
-        if war_val is None or isinstance(war_val, float) and math.isnan(war_val):
+    history_seasons = 0
+    for season, war_key in history_window(snapshot_year):
+        war_val = war_entry.get(war_key)
+        if war_val is None or war_val != war_val:
             war_val = 0.0
-        usage_val = 0.0
-        if projection_role in {"SP", "RP"}:
-            usage_val = usage.get(season, {}).get("ip", 0.0)
-        else:
-            usage_val = usage.get(season, {}).get("pa", 0.0)
-        history.append(SeasonHistory(season=season, war=float(war_val), usage=float(usage_val)))
-
-    pa_total, ip_total = total_usage(usage)
-    history_seasons = seasons_with_usage(history)
+        season_usage = usage.get(season)
+        usage_val = float(season_usage.get(usage_key, 0.0)) if season_usage else 0.0
+        if usage_val > 0:
+            history_seasons += 1
+        history.append(SeasonHistory(season=season, war=float(war_val), usage=usage_val))
+
+    pa_total = usage_summary.pa
+    ip_total = usage_summary.ip
     has_track_record = history_seasons >= 2
-    if projection_role in {"SP", "RP"}:
-        denom = 180.0
-        base_rate_prior = config.rate_prior.get(projection_role, config.rate_prior.get("SP", 2.5))
-        if (ip_total < config.small_sample_ip) or (not has_track_record):
-            rate_prior = 0.0
-        else:
-            rate_prior = base_rate_prior
-        k_rate = config.k_rate.get(projection_role, config.k_rate.get("SP", 180))
-        k_u = config.k_usage.get(projection_role, config.k_usage.get("SP", 180))
+    if is_pitcher:
+        role_key = projection_role
+        denom = PITCHER_USAGE_DENOM
+        small_sample = ip_total < config.small_sample_ip
         aging = config.aging_curve_pitch
     else:
-        denom = 600.0
-        base_rate_prior = config.rate_prior.get(projection_role, config.rate_prior.get("H", 2.0))
-        if (pa_total < config.small_sample_pa) or (not has_track_record):
-            rate_prior = 0.0
-        else:
-            rate_prior = base_rate_prior
-        k_rate = config.k_rate.get(projection_role, config.k_rate.get("H", 600))
-        k_u = config.k_usage.get(projection_role, config.k_usage.get("H", 600))
+        role_key = projection_role if projection_role in PROJECTION_ROLES else "H"
+        denom = HITTER_USAGE_DENOM
+        small_sample = pa_total < config.small_sample_pa
         aging = config.aging_curve_hit
+    rate_prior = 0.0 if small_sample or not has_track_record else config.rate_prior[role_key]
+    k_rate = config.k_rate[role_key]
+    k_u = config.k_usage[role_key]
 
-    usage_prior = usage_prior_for_player(projection_role, usage, config)
+    usage_prior = usage_prior_for_player(projection_role, usage_summary, config)
     projection = build_rate_projection(
         history,
         denom,
@@ -1091,17 +1218,37 @@ def projected_war_next_year(
         usage_prior,
         k_u,
     )
+    return PlayerProjection(
+        role=projection_role,
+        is_pitcher=is_pitcher,
+        history=history,
+        usage=usage_summary,
+        denom=denom,
+        aging=aging,
+        projection=projection,
+    )
+
+
+def projected_war_next_year(
+    player: dict[str, Any],
+    config: MLBV1Config,
+    snapshot_year: int,
+) -> tuple[str, float] | None:
+    age = player.get("age")
+    if age is None:
+        return None
+    projected = project_player(player, config, snapshot_year)
     expected = expected_war_path(
-        projection.rate_post,
-        projection.usage_post,
-        age,
+        projected.projection.rate_post,
+        projected.projection.usage_post,
+        int(age),
         1,
-        denom,
-        aging,
+        projected.denom,
+        projected.aging,
     )
     if not expected:
         return None
-    return projection_role, expected[0]
+    return projected.role, expected[0]
 
 
 def calibrate_price_P0(
@@ -1110,17 +1257,20 @@ def calibrate_price_P0(
     snapshot_year: int,
 ) -> tuple[float, dict[str, Any]]:
     window_years = max(1, int(config.p0_window_years))
-    calibration_years = set(range(snapshot_year - window_years + 1, snapshot_year + 1))
+    window_start = snapshot_year - window_years + 1
     implied: list[float] = []
     for player in players:
         contract = player.get("contract", {}) or {}
         if not contract.get("contract_years"):
             continue
         start_year = contract_start_year(contract)
-        if start_year is None or start_year not in calibration_years:
+        if start_year is None or not window_start <= start_year <= snapshot_year:
             continue
         if guaranteed_years(contract) < config.p0_years_min:
             continue
+        aav = resolve_market_aav(contract, int(player["mlbam_id"]), snapshot_year, config)
+        if aav is None or aav < config.p0_aav_min:
+            continue
         projection = projected_war_next_year(player, config, snapshot_year)
         if not projection:
             continue
@@ -1129,13 +1279,10 @@ def calibrate_price_P0(
             continue
         if war_next < config.p0_war_min:
             continue
-        aav = resolve_market_aav(contract, int(player["mlbam_id"]), snapshot_year, config)
-        if aav is None or aav < config.p0_aav_min:
-            continue
         implied.append(float(aav) / float(war_next))
 
     trimmed = _trimmed(implied, config.p0_trim_pct)
-    median = _median(trimmed) if trimmed else config.price_P0
+    median = _median_sorted(trimmed) if trimmed else config.price_P0
     summary = {
         "calibrated": bool(trimmed),
         "samples": len(implied),
@@ -1143,8 +1290,8 @@ def calibrate_price_P0(
         "median": median,
         "trim_pct": config.p0_trim_pct,
         "window_years": window_years,
-        "window_start_year": min(calibration_years) if calibration_years else snapshot_year,
-        "window_end_year": max(calibration_years) if calibration_years else snapshot_year,
+        "window_start_year": window_start,
+        "window_end_year": snapshot_year,
         "filters": {
             "aav_min": config.p0_aav_min,
             "years_min": config.p0_years_min,
@@ -1154,6 +1301,45 @@ def calibrate_price_P0(
     }
     return median, summary
 
+_WORKER_ARGS: tuple[MLBV1Config, int, float, set[int]] | None = None
+
+
+def _init_output_worker(
+    config: MLBV1Config,
+    snapshot_year: int,
+    in_season_fraction: float,
+    super_two_ids: set[int],
+) -> None:
+    global _WORKER_ARGS
+    _WORKER_ARGS = (config, snapshot_year, in_season_fraction, super_two_ids)
+
+
+def _build_output_in_worker(player: dict[str, Any]) -> PlayerOutput | None:
+    return build_player_output(player, *_WORKER_ARGS)
+
+
+def build_player_outputs(
+    players: list[dict[str, Any]],
+    config: MLBV1Config,
+    snapshot_year: int,
+    in_season_fraction: float,
+    super_two_ids: set[int],
+    workers: int = 1,
+) -> list[PlayerOutput]:
+    shared = (config, snapshot_year, in_season_fraction, super_two_ids)
+    if workers <= 1 or len(players) < PARALLEL_MIN_PLAYERS:
+        results = (build_player_output(player, *shared) for player in players)
+    else:
+        chunksize = max(16, len(players) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_output_worker,
+            initargs=shared,
+        ) as executor:
+            results = list(executor.map(_build_output_in_worker, players, chunksize=chunksize))
+    return [output for output in results if output]
+
+
 def compute_talent_value_p50(
     war_path: list[float],
     price_by_year: list[float],
@@ -1161,12 +1347,12 @@ def compute_talent_value_p50(
     in_season_fraction: float,
 ) -> float:
     total = 0.0
+    discount_by_t = discount_factors(discount_rate, len(war_path))
     for t, war_t in enumerate(war_path):
         if t == 0:
             war_t *= in_season_fraction
         value = war_t * price_by_year[t]
-        discount = 1.0 / ((1.0 + discount_rate) ** t)
-        total += value * discount
+        total += value * discount_by_t[t]
     return total
 
 
@@ -1182,10 +1368,22 @@ def build_snapshot_players(
 
     war_data = load_war_data(war_path)
     contracts = load_contracts(contract_path)
-    service_time = load_service_time(db_path)
-    usage_stats = load_usage_stats(db_path, [snapshot_year - 3, snapshot_year - 2, snapshot_year - 1])
-    metric_history = load_metric_history(db_path, snapshot_year - 1, config)
+    service_time: dict[int, ServiceTimeRecord] = {}
+    usage_stats: dict[int, dict[int, dict[str, float]]] = {}
+    metric_history: dict[int, dict[str, float]] = {}
+    conn = open_stats_db(db_path)
+    if conn is not None:
+        with closing(conn):
+            service_time = load_service_time(conn)
+            usage_stats = load_usage_stats(conn, [snapshot_year - 3, snapshot_year - 2, snapshot_year - 1])
+            metric_history = load_metric_history(conn, snapshot_year - 1, config)
     positions = load_positions_map(REPO_ROOT / "backend" / "player_positions_fixture.json")
+    usage_summaries = {mlbam_id: summarize_usage(usage) for mlbam_id, usage in usage_stats.items()}
+    eligible_ids = {
+        mlbam_id
+        for mlbam_id in service_time.keys() | usage_summaries.keys()
+        if is_player_eligible(service_time.get(mlbam_id), usage_summaries.get(mlbam_id, EMPTY_USAGE))
+    }
 
     players: list[dict[str, Any]] = []
     for entry in contracts:
@@ -1193,14 +1391,14 @@ def build_snapshot_players(
         if mlbam_id is None:
             continue
         mlbam_id = int(mlbam_id)
+        if mlbam_id not in eligible_ids:
+            continue
         war_entry = war_data.get(mlbam_id)
         if not war_entry:
             continue
         usage = usage_stats.get(mlbam_id, {})
-        role, gs_share = determine_role(usage, config)
         service_record = service_time.get(mlbam_id)
-        if not is_player_eligible(service_record, usage):
-            continue
+        role, gs_share = determine_role(usage_summaries.get(mlbam_id, EMPTY_USAGE), config)
         players.append(
             {
                 "mlbam_id": mlbam_id,
@@ -1275,56 +1473,16 @@ def build_player_output(
     age = int(age)
     role_code = player.get("role")
     usage = player.get("usage", {})
-    war_entry = player.get("war", {})
     gs_share = player.get("gs_share")
-    projection_role = resolve_projection_role(role_code, usage, gs_share, config)
-
-    history: list[SeasonHistory] = []
-    for season in [snapshot_year - 3, snapshot_year - 2, snapshot_year - 1]:
-        war_val = war_entry.get(f"war_{season}")
-        if war_val is None or isinstance(war_val, float) and math.isnan(war_val):
-            war_val = 0.0
-        usage_val = 0.0
-        if projection_role in {"SP", "RP"}:
-            usage_val = usage.get(season, {}).get("ip", 0.0)
-        else:
-            usage_val = usage.get(season, {}).get("pa", 0.0)
-        history.append(SeasonHistory(season=season, war=float(war_val), usage=float(usage_val)))
-
-    pa_total, ip_total = total_usage(usage)
+    position = player.get("position")
+    projected = project_player(player, config, snapshot_year)
+    is_pitcher = projected.is_pitcher
+    pa_total = projected.usage.pa
+    ip_total = projected.usage.ip
+    denom = projected.denom
+    aging = projected.aging
+    projection = projected.projection
     seasons_present = usage_window_seasons_present(usage)
-    history_seasons = seasons_with_usage(history)
-    has_track_record = history_seasons >= 2
-    if projection_role in {"SP", "RP"}:
-        denom = 180.0
-        base_rate_prior = config.rate_prior.get(projection_role, config.rate_prior.get("SP", 2.5))
-        if (ip_total < config.small_sample_ip) or (not has_track_record):
-            rate_prior = 0.0
-        else:
-            rate_prior = base_rate_prior
-        k_rate = config.k_rate.get(projection_role, config.k_rate.get("SP", 180))
-        k_u = config.k_usage.get(projection_role, config.k_usage.get("SP", 180))
-        aging = config.aging_curve_pitch
-    else:
-        denom = 600.0
-        base_rate_prior = config.rate_prior.get(projection_role, config.rate_prior.get("H", 2.0))
-        if (pa_total < config.small_sample_pa) or (not has_track_record):
-            rate_prior = 0.0
-        else:
-            rate_prior = base_rate_prior
-        k_rate = config.k_rate.get(projection_role, config.k_rate.get("H", 600))
-        k_u = config.k_usage.get(projection_role, config.k_usage.get("H", 600))
-        aging = config.aging_curve_hit
-
-    usage_prior = usage_prior_for_player(projection_role, usage, config)
-    projection = build_rate_projection(
-        history,
-        denom,
-        rate_prior,
-        k_rate,
-        usage_prior,
-        k_u,
-    )
     metric_history = player.get("metric_history", {}) or {}
     war_rate_war = projection.rate_post
     war_rate_post_final = war_rate_war
@@ -1336,7 +1494,7 @@ def build_player_output(
     fip_delta = None
 
     if config.metric_enabled:
-        if projection_role in {"SP", "RP"}:
+        if is_pitcher:
             fip_weighted = metric_history.get("fip_weighted")
             lg_fip_weighted = metric_history.get("lg_fip_weighted")
             ip_total_metric = metric_history.get("fip_ip_total", 0.0)
@@ -1413,20 +1571,20 @@ def build_player_output(
     )
 
     durability = build_mixture(
-        DurabilityInputs(is_pitcher=projection_role in {"SP", "RP"}, age=age),
+        DurabilityInputs(is_pitcher=is_pitcher, age=age),
         config.durability_hit,
         config.durability_pitch,
     )
 
     role_prob_sp = None
-    if projection_role in {"SP", "RP"}:
-        prior_sp = sp_prob_by_age(age, config.sp_prob_by_age)
+    if is_pitcher:
+        prior_sp = sp_prob_by_age(age, config.sp_prob_ages, config.sp_prob_values)
         if gs_share is None:
             role_prob_sp = prior_sp
         else:
             role_prob_sp = (prior_sp + float(gs_share)) / 2.0
 
-    shock_sd = config.year_shock_sd_pitch if projection_role in {"SP", "RP"} else config.year_shock_sd_hit
+    shock_sd = config.year_shock_sd_pitch if is_pitcher else config.year_shock_sd_hit
     talent_sd = config.talent_sd
     sim_config = SimulationConfig(
         sims=config.simulations,
@@ -1450,16 +1608,6 @@ def build_player_output(
     sim_result = simulate_tvp(sim_config, sim_inputs, expected_war)
     risk_adj = risk_adjusted_value(sim_result.mean, sim_result.std, config.risk_aversion_lambda)
 
-    flags = {
-        "high_defense_uncertainty": player.get("position") is None,
-        "pitcher_tail_risk": projection_role in {"SP", "RP"} and any(
-            state.label == "lost" and state.probability >= 0.12 for state in durability.states
-        ),
-        "small_sample": projection.n_usage
-        < (config.small_sample_ip if projection_role in {"SP", "RP"} else config.small_sample_pa),
-        "role_change_risk": role_code == "HYB"
-        or (role_prob_sp is not None and 0.3 < role_prob_sp < 0.7),
-    }
     components = None
     if config.metric_enabled:
         components = {
@@ -1476,9 +1624,7 @@ def build_player_output(
             "metric_adjustment_clamped": metric_adjustment_clamped,
             "war_rate_post_final": war_rate_post_final,
         }
-    leaderboard_ok = leaderboard_eligible(role_code, usage, service_record, config)
-    flags["leaderboard_eligible"] = leaderboard_ok
-    flags["small_sample"] = flags["small_sample"] or (not leaderboard_ok)
+    leaderboard_ok = leaderboard_eligible(role_code, projected.usage, service_record, config)
 
     breakdown = build_breakdown(
         snapshot_year,
@@ -1500,18 +1646,34 @@ def build_player_output(
     is_backloaded = backloaded_contract(schedule, threshold=1.25)
 
     service_time_label = service_record.service_time_label if service_record else None
+    quantiles = sim_result.quantiles
+    flags = {
+        "high_defense_uncertainty": position is None,
+        "pitcher_tail_risk": is_pitcher and any(
+            state.label == "lost" and state.probability >= 0.12 for state in durability.states
+        ),
+        "small_sample": projection.n_usage
+        < (config.small_sample_ip if is_pitcher else config.small_sample_pa)
+        or (not leaderboard_ok),
+        "role_change_risk": role_code == "HYB"
+        or (role_prob_sp is not None and 0.3 < role_prob_sp < 0.7),
+        "leaderboard_eligible": leaderboard_ok,
+        "backloaded_contract": is_backloaded,
+        "late_negative_surplus": late_negative_years >= 2,
+        "contract_ignored_prospect_like": contract_ignored,
+    }
     return PlayerOutput(
         mlbam_id=mlbam_id,
         name=player.get("name") or str(mlbam_id),
         team=player.get("team"),
         age=age,
         role=role_code,
-        position=player.get("position"),
+        position=position,
         status_t=status_t,
         tvp=risk_adj,
-        tvp_p10=sim_result.quantiles.get("p10", 0.0),
-        tvp_p50=sim_result.quantiles.get("p50", 0.0),
-        tvp_p90=sim_result.quantiles.get("p90", 0.0),
+        tvp_p10=quantiles.get("p10", 0.0),
+        tvp_p50=quantiles.get("p50", 0.0),
+        tvp_p90=quantiles.get("p90", 0.0),
         talent_value_p50=talent_value_p50,
         tvp_mean=sim_result.mean,
         tvp_std=sim_result.std,
@@ -1524,12 +1686,7 @@ def build_player_output(
         metric_adjustment_raw=metric_adjustment_raw,
         metric_adjustment_clamped=metric_adjustment_clamped,
         war_rate_post_final=war_rate_post_final,
-        flags={
-            **flags,
-            "backloaded_contract": is_backloaded,
-            "late_negative_surplus": late_negative_years >= 2,
-            "contract_ignored_prospect_like": contract_ignored,
-        },
+        flags=flags,
         contract_source=contract_source,
         contract_confidence=contract_confidence,
         late_negative_surplus_years=late_negative_years,
@@ -1542,6 +1699,45 @@ def build_player_output(
     )
 
 
+@dataclass(frozen=True, slots=True)
+class TvpRuntimeParams:
+    snapshot_date: str
+    war_source: str
+    use_saved_snapshot: Path | None
+    top: int
+    include_small_sample: bool
+    require_service_time: bool
+    emit_both_rankers: bool
+    emit_top: int | None
+    emit_bottom: int | None
+    sanity_check: str | None
+    rank_by: str | None
+    config: Path
+    db: Path
+    data_dir: Path
+    workers: int
+
+
+def runtime_params_from_args(args: argparse.Namespace) -> TvpRuntimeParams:
+    return TvpRuntimeParams(
+        snapshot_date=args.snapshot_date,
+        war_source=args.war_source,
+        use_saved_snapshot=args.use_saved_snapshot,
+        top=args.top,
+        include_small_sample=args.include_small_sample,
+        require_service_time=args.require_service_time,
+        emit_both_rankers=args.emit_both_rankers,
+        emit_top=args.emit_top,
+        emit_bottom=args.emit_bottom,
+        sanity_check=args.sanity_check,
+        rank_by=args.rank_by,
+        config=args.config,
+        db=args.db,
+        data_dir=args.data_dir,
+        workers=max(1, args.workers),
+    )
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Compute MLB TVP (v1 Surplus-Value model).")
     parser.add_argument("--snapshot-date", required=True, help="YYYY-MM-DD snapshot date")
@@ -1586,11 +1782,17 @@ def main() -> None:
     parser.add_argument("--config", type=Path, default=REPO_ROOT / "backend" / "tvp_config.json")
     parser.add_argument("--db", type=Path, default=REPO_ROOT / "backend" / "stats.db")
     parser.add_argument("--data-dir", type=Path, default=REPO_ROOT / "backend" / "output")
-    args = parser.parse_args()
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for per-player simulation (default 1, serial).",
+    )
+    params = runtime_params_from_args(parser.parse_args())
 
-    snapshot_date = datetime.strptime(args.snapshot_date, "%Y-%m-%d").date()
+    snapshot_date = datetime.strptime(params.snapshot_date, "%Y-%m-%d").date()
     snapshot_year = snapshot_date.year
-    config = load_config(args.config, args.war_source)
+    config = load_config(params.config, params.war_source)
 
     season_window = SeasonWindow(
         start=date(snapshot_year, config.season_window.start.month, config.season_window.start.day),
@@ -1598,70 +1800,56 @@ def main() -> None:
     )
     in_season_fraction = remaining_games_fraction(snapshot_date, season_window)
 
-    if args.use_saved_snapshot:
-        with args.use_saved_snapshot.open() as handle:
-            snapshot_data = json.load(handle)
+    if params.use_saved_snapshot:
+        snapshot_data = read_json(params.use_saved_snapshot)
         players = snapshot_data.get("players", [])
     else:
-        players = build_snapshot_players(snapshot_year, args.war_source, args.data_dir, args.db, config)
+        players = build_snapshot_players(snapshot_year, params.war_source, params.data_dir, params.db, config)
 
-    service_records = [p.get("service_time") for p in players if p.get("service_time")]
-    service_records = [rec for rec in service_records if isinstance(rec, ServiceTimeRecord)]
+    service_records = [
+        record for record in (p.get("service_time") for p in players) if isinstance(record, ServiceTimeRecord)
+    ]
     super_two = super_two_for_snapshot(service_records, snapshot_date, season_window)
 
     calibrated_p0, calibration_summary = calibrate_price_P0(players, config, snapshot_year)
     config = replace(config, price_P0=calibrated_p0)
 
-    outputs: list[PlayerOutput] = []
-    for player in players:
-        output = build_player_output(
-            player,
-            config,
-            snapshot_year,
-            in_season_fraction,
-            super_two.super_two_ids,
-        )
-        if output:
-            outputs.append(output)
+    outputs = build_player_outputs(
+        players,
+        config,
+        snapshot_year,
+        in_season_fraction,
+        super_two.super_two_ids,
+        params.workers,
+    )
 
-    def sort_by_metric(metric: str) -> list[PlayerOutput]:
-        if metric == "tvp_mean":
-            key = lambda o: o.tvp_mean
-        elif metric == "tvp_risk_adj":
-            key = lambda o: o.tvp_risk_adj
-        elif metric == "talent_value_p50":
-            key = lambda o: o.talent_value_p50
-        else:
-            key = lambda o: o.tvp_p50
-        return sorted(outputs, key=key, reverse=True)
+    sorted_by_metric: dict[str, list[PlayerOutput]] = {}
 
-    rank_by = args.rank_by or config.leaderboard_rank_by
+    def sort_by_metric(metric: str) -> list[PlayerOutput]:
+        if metric not in ("tvp_mean", "tvp_risk_adj", "talent_value_p50"):
+            metric = "tvp_p50"
+        ranked = sorted_by_metric.get(metric)
+        if ranked is None:
+            ranked = sorted_by_metric[metric] = sorted(outputs, key=attrgetter(metric), reverse=True)
+        return ranked
+
+    rank_by = params.rank_by or config.leaderboard_rank_by
     outputs_sorted = sort_by_metric(rank_by)
-    leaderboard_pool = [o for o in outputs_sorted if o.flags.get("leaderboard_eligible", True)]
-    if args.include_small_sample:
-        eligible_outputs = leaderboard_pool
-    else:
-        eligible_outputs = [o for o in leaderboard_pool if not o.flags.get("small_sample", False)]
-    top = eligible_outputs[: args.top]
+    leaderboard_pool, eligible_outputs = leaderboard_partition(outputs_sorted, params.include_small_sample)
+    top = eligible_outputs[: params.top]
 
-    zero_service_all = sum(
-        1 for o in outputs_sorted if (o.service_time is None or o.service_time in {"0", "0/000", "00/000"})
-    )
-    zero_service_lb = sum(
-        1
-        for o in leaderboard_pool
-        if (o.service_time is None or o.service_time in {"0", "0/000", "00/000"})
-    )
-    zero_service_top = sum(
-        1
-        for o in top
-        if (o.service_time is None or o.service_time in {"0", "0/000", "00/000"})
-    )
+    zero_service_all = zero_service_count(outputs_sorted)
+    zero_service_lb = zero_service_count(leaderboard_pool)
+    zero_service_top = zero_service_count(top)
     zero_pct_all = zero_service_all / len(outputs_sorted) if outputs_sorted else 0.0
     zero_pct_lb = zero_service_lb / len(leaderboard_pool) if leaderboard_pool else 0.0
     zero_pct_top = zero_service_top / len(top) if top else 0.0
     service_time_ok = zero_pct_lb <= config.service_time_zero_max_pct
-    data_ok = coverage_ok(args.db, [snapshot_year - 3, snapshot_year - 2, snapshot_year - 1])
+    data_ok = False
+    stats_conn = open_stats_db(params.db)
+    if stats_conn is not None:
+        with closing(stats_conn):
+            data_ok = coverage_ok(stats_conn, [snapshot_year - 3, snapshot_year - 2, snapshot_year - 1])
     pricing_suffix = f"nominal_g{config.price_growth:.2f}_d{config.discount_rate:.2f}".replace(".", "p")
     meta_extra = {
         "data_coverage_ok": data_ok,
@@ -1686,17 +1874,17 @@ def main() -> None:
         "min_fip_ip_total": config.min_fip_ip_total,
         "metric_recent_season_weight": config.metric_recent_season_weight,
     }
-    if args.require_service_time and not service_time_ok:
+    if params.require_service_time and not service_time_ok:
         raise SystemExit(
             f"Service time coverage failed: {zero_pct_lb:.1%} of leaderboard players have zero service time."
         )
 
     json_path, csv_path = emit_outputs(
         REPO_ROOT / "backend" / "output",
-        args.snapshot_date,
-        args.war_source,
+        params.snapshot_date,
+        params.war_source,
         top,
-        args.top,
+        params.top,
         prefix="top",
         rank_by=rank_by,
         label=f"{rank_by}_{pricing_suffix}",
@@ -1705,21 +1893,17 @@ def main() -> None:
 
     print(f"Wrote {len(top)} players to {json_path} and {csv_path}")
 
-    if args.emit_both_rankers:
+    if params.emit_both_rankers:
         trade_rank = "tvp_risk_adj"
         trade_sorted = sort_by_metric(trade_rank)
-        trade_pool = [o for o in trade_sorted if o.flags.get("leaderboard_eligible", True)]
-        if args.include_small_sample:
-            trade_eligible = trade_pool
-        else:
-            trade_eligible = [o for o in trade_pool if not o.flags.get("small_sample", False)]
-        trade_top = trade_eligible[: args.top]
+        _, trade_eligible = leaderboard_partition(trade_sorted, params.include_small_sample)
+        trade_top = trade_eligible[: params.top]
         trade_json, trade_csv = emit_outputs(
             REPO_ROOT / "backend" / "output",
-            args.snapshot_date,
-            args.war_source,
+            params.snapshot_date,
+            params.war_source,
             trade_top,
-            args.top,
+            params.top,
             prefix="top",
             rank_by=trade_rank,
             label=f"trade_value_{pricing_suffix}",
@@ -1729,18 +1913,14 @@ def main() -> None:
 
         talent_rank = "talent_value_p50"
         talent_sorted = sort_by_metric(talent_rank)
-        talent_pool = [o for o in talent_sorted if o.flags.get("leaderboard_eligible", True)]
-        if args.include_small_sample:
-            talent_eligible = talent_pool
-        else:
-            talent_eligible = [o for o in talent_pool if not o.flags.get("small_sample", False)]
-        talent_top = talent_eligible[: args.top]
+        _, talent_eligible = leaderboard_partition(talent_sorted, params.include_small_sample)
+        talent_top = talent_eligible[: params.top]
         talent_json, talent_csv = emit_outputs(
             REPO_ROOT / "backend" / "output",
-            args.snapshot_date,
-            args.war_source,
+            params.snapshot_date,
+            params.war_source,
             talent_top,
-            args.top,
+            params.top,
             prefix="top",
             rank_by=talent_rank,
             label=f"best_players_{pricing_suffix}",
@@ -1748,28 +1928,28 @@ def main() -> None:
         )
         print(f"Wrote {len(talent_top)} players to {talent_json} and {talent_csv}")
 
-        trade_ranks = {o.mlbam_id: idx + 1 for idx, o in enumerate(trade_sorted)}
-        talent_ranks = {o.mlbam_id: idx + 1 for idx, o in enumerate(talent_sorted)}
+        trade_ranks = dict(zip(map(MLBAM_ID, trade_sorted), itertools.count(1)))
+        talent_ranks = dict(zip(map(MLBAM_ID, talent_sorted), itertools.count(1)))
         combined_json, combined_csv = emit_ranked_outputs(
             REPO_ROOT / "backend" / "output",
-            args.snapshot_date,
-            args.war_source,
+            params.snapshot_date,
+            params.war_source,
             trade_top,
             {"tvp_risk_adj": trade_ranks, "talent_value_p50": talent_ranks},
-            args.top,
+            params.top,
             prefix="top",
             label=f"combined_{pricing_suffix}",
             meta_extra=meta_extra,
         )
         print(f"Wrote {len(trade_top)} players to {combined_json} and {combined_csv}")
 
-    if args.emit_top is not None:
-        emit_top_n = max(1, int(args.emit_top))
+    if params.emit_top is not None:
+        emit_top_n = max(1, int(params.emit_top))
         emit_top = eligible_outputs[:emit_top_n]
         extra_json, extra_csv = emit_outputs(
             REPO_ROOT / "backend" / "output",
-            args.snapshot_date,
-            args.war_source,
+            params.snapshot_date,
+            params.war_source,
             emit_top,
             emit_top_n,
             prefix="top",
@@ -1779,13 +1959,13 @@ def main() -> None:
         )
         print(f"Wrote {len(emit_top)} players to {extra_json} and {extra_csv}")
 
-    if args.emit_bottom is not None:
-        emit_bottom_n = max(1, int(args.emit_bottom))
+    if params.emit_bottom is not None:
+        emit_bottom_n = max(1, int(params.emit_bottom))
         emit_bottom = list(reversed(eligible_outputs[-emit_bottom_n:])) if eligible_outputs else []
         bottom_json, bottom_csv = emit_outputs(
             REPO_ROOT / "backend" / "output",
-            args.snapshot_date,
-            args.war_source,
+            params.snapshot_date,
+            params.war_source,
             emit_bottom,
             emit_bottom_n,
             prefix="bottom",
@@ -1795,9 +1975,9 @@ def main() -> None:
         )
         print(f"Wrote {len(emit_bottom)} players to {bottom_json} and {bottom_csv}")
 
-    if args.sanity_check:
+    if params.sanity_check:
         raw_lookup = {p["mlbam_id"]: p for p in players}
-        tokens = [t.strip() for t in args.sanity_check.split(",") if t.strip()]
+        tokens = [t.strip() for t in params.sanity_check.split(",") if t.strip()]
         for token in tokens:
             player = None
             if token.isdigit():
@@ -5,6 +5,7 @@ import json
 from datetime import datetime, timezone
 from pathlib import Path
 
+from data_utils import dumps_json
 from tvp_engine import compute_prospect_tvp, load_config
 
 
@@ -63,8 +64,7 @@ def main() -> None:
         "prospects": results,
     }
 
-    with output_path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, ensure_ascii=True)
+    output_path.write_text(dumps_json(payload), encoding="utf-8")
 
     print(f"Wrote {len(results)} prospects to {output_path}")
 
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContractYear:
     season: int
     cost_m: float
@@ -26,6 +27,11 @@ def min_salary_for_year(index: int, min_salary_m: float, growth: float) -> float
     return min_salary_m * ((1.0 + growth) ** index)
 
 
+@lru_cache(maxsize=None)
+def min_salary_curve(min_salary_m: float, growth: float, years: int) -> tuple[float, ...]:
+    return tuple(min_salary_for_year(t, min_salary_m, growth) for t in range(years))
+
+
 def arb_cost(
     war_expected: float,
     war_price: float,
@@ -68,11 +74,7 @@ def build_option_schedule(contract: dict[str, Any]) -> dict[int, dict[str, Any]]
         season = option.get("season")
         if season is None:
             continue
-        options[int(season)] = {
-            "type": option.get("type"),
-            "salary_m": option.get("salary_m"),
-            "buyout_m": option.get("buyout_m"),
-        }
+        options[int(season)] = option
     return options
 
 
@@ -92,14 +94,16 @@ def build_contract_schedule(
     options = build_option_schedule(contract)
     years: list[ContractYear] = []
     basis_label = guaranteed_basis or "guaranteed"
+    min_salary_by_t = min_salary_curve(min_salary_m, min_salary_growth, horizon_years)
 
     for t in range(horizon_years):
         season = snapshot_year + t
-        if season in guaranteed:
-            years.append(ContractYear(season, float(guaranteed[season]), basis_label))
+        guaranteed_cost = guaranteed.get(season)
+        if guaranteed_cost is not None:
+            years.append(ContractYear(season, float(guaranteed_cost), basis_label))
             continue
-        if season in options:
-            option = options[season]
+        option = options.get(season)
+        if option is not None:
             salary = option.get("salary_m")
             years.append(
                 ContractYear(
@@ -115,7 +119,7 @@ def build_contract_schedule(
         if t < len(control_year_types):
             year_type = control_year_types[t]
             if year_type == "prearb":
-                cost = min_salary_for_year(t, min_salary_m, min_salary_growth)
+                cost = min_salary_by_t[t]
                 years.append(ContractYear(season, cost, "model_cost_prearb"))
             else:
                 arb_index = int(year_type.replace("arb", "")) - 1
@@ -1,7 +1,32 @@
 from __future__ import annotations
 
+import json
 import re
 from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+def read_json(path: Path) -> Any:
+    try:
+        return orjson.loads(path.read_bytes())
+    except orjson.JSONDecodeError:
+        pass
+    with path.open("r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def dumps_json(obj: Any, indent: bool = False) -> str:
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    try:
+        return orjson.dumps(obj, option=option).decode()
+    except orjson.JSONEncodeError:
+        pass
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
 
 
 def normalize_columns(columns: list[str]) -> list[str]:
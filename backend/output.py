@@ -5,12 +5,14 @@ import json
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from backend.contracts import ContractYear
+from backend.data_utils import dumps_json
+from backend.simulate import discount_factors
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlayerOutput:
     mlbam_id: int
     name: str
@@ -87,6 +89,19 @@ def _player_payload(p: PlayerOutput) -> dict[str, Any]:
     return payload
 
 
+def _write_players_json(path: Path, meta: dict[str, Any], players: Iterable[dict[str, Any]]) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write('{\n  "meta": ')
+        handle.write(dumps_json(meta, indent=True).replace("\n", "\n  "))
+        handle.write(',\n  "players": [')
+        empty = True
+        for player in players:
+            handle.write("\n    " if empty else ",\n    ")
+            handle.write(dumps_json(player, indent=True).replace("\n", "\n    "))
+            empty = False
+        handle.write("]\n}" if empty else "\n  ]\n}")
+
+
 def build_breakdown(
     snapshot_year: int,
     war_path: list[float],
@@ -96,6 +111,7 @@ def build_breakdown(
     in_season_fraction: float = 1.0,
 ) -> list[dict[str, Any]]:
     breakdown = []
+    discount_by_t = discount_factors(discount_rate, len(war_path))
     for t, war_t in enumerate(war_path):
         year = snapshot_year + t
         price = war_price_by_year[t]
@@ -106,7 +122,7 @@ def build_breakdown(
         if t == 0:
             cost *= in_season_fraction
         surplus = value - cost
-        discount = 1.0 / ((1.0 + discount_rate) ** t)
+        discount = discount_by_t[t]
         pv = surplus * discount
         breakdown.append(
             {
@@ -151,13 +167,7 @@ def emit_outputs(
         meta["rank_by"] = rank_by
     if meta_extra:
         meta.update(meta_extra)
-    payload = {
-        "meta": meta,
-        "players": [_player_payload(p) for p in results],
-    }
-
-    with json_path.open("w") as handle:
-        json.dump(payload, handle, indent=2)
+    _write_players_json(json_path, meta, map(_player_payload, results))
 
     with csv_path.open("w", newline="") as handle:
         handle.write(f"# meta: {json.dumps(meta, sort_keys=True)}\n")
@@ -266,16 +276,14 @@ def emit_ranked_outputs(
     if meta_extra:
         meta.update(meta_extra)
 
-    players_payload: list[dict[str, Any]] = []
-    for p in results:
-        payload = _player_payload(p)
-        payload["rank_trade_value"] = ranks.get("tvp_risk_adj", {}).get(p.mlbam_id)
-        payload["rank_best_players"] = ranks.get("talent_value_p50", {}).get(p.mlbam_id)
-        players_payload.append(payload)
+    def ranked_payloads() -> Iterable[dict[str, Any]]:
+        for p in results:
+            payload = _player_payload(p)
+            payload["rank_trade_value"] = ranks.get("tvp_risk_adj", {}).get(p.mlbam_id)
+            payload["rank_best_players"] = ranks.get("talent_value_p50", {}).get(p.mlbam_id)
+            yield payload
 
-    payload = {"meta": meta, "players": players_payload}
-    with json_path.open("w") as handle:
-        json.dump(payload, handle, indent=2)
+    _write_players_json(json_path, meta, ranked_payloads())
 
     with csv_path.open("w", newline="") as handle:
         handle.write(f"# meta: {json.dumps(meta, sort_keys=True)}\n")
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable
+from functools import lru_cache
+from typing import Iterable, NamedTuple
 
 
 @dataclass(frozen=True)
@@ -25,8 +26,16 @@ class AgingCurve:
         return max(0.0, 1.0 + delta * self.usage_delta_after)
 
 
-@dataclass(frozen=True)
-class SeasonHistory:
+@lru_cache(maxsize=None)
+def aging_schedule(aging: AgingCurve, age: int, years: int) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    ages = range(age, age + years)
+    return (
+        tuple(aging.rate_multiplier(age_t) for age_t in ages),
+        tuple(aging.usage_multiplier(age_t) for age_t in ages),
+    )
+
+
+class SeasonHistory(NamedTuple):
     season: int
     war: float
     usage: float
@@ -44,39 +53,28 @@ class RateProjection:
 MARCE_L_WEIGHTS = (3.0, 4.0, 5.0)
 
 
-def weighted_rate(history: Iterable[SeasonHistory], denom: float) -> tuple[float, float]:
+def weighted_history(history: Iterable[SeasonHistory], denom: float) -> tuple[float, float, float]:
     seasons = list(history)
     if not seasons:
-        return 0.0, 0.0
+        return 0.0, 0.0, 0.0
     weights = MARCE_L_WEIGHTS[-len(seasons):]
     weighted_war = 0.0
     weighted_usage = 0.0
     usage_total = 0.0
-    for weight, entry in zip(weights, seasons):
-        if entry.usage <= 0:
-            continue
-        weighted_war += weight * entry.war
-        weighted_usage += weight * entry.usage
-        usage_total += entry.usage
-    if weighted_usage <= 0:
-        return 0.0, usage_total
-    rate_obs = weighted_war / (weighted_usage / denom)
-    return rate_obs, usage_total
-
-
-def weighted_usage(history: Iterable[SeasonHistory]) -> float:
-    seasons = list(history)
-    if not seasons:
-        return 0.0
-    weights = MARCE_L_WEIGHTS[-len(seasons):]
-    total_weight = 0.0
     usage_sum = 0.0
+    total_weight = 0.0
     for weight, entry in zip(weights, seasons):
-        usage_sum += weight * entry.usage
+        usage = entry.usage
+        usage_sum += weight * usage
         total_weight += weight
-    if total_weight <= 0:
-        return 0.0
-    return usage_sum / total_weight
+        if usage <= 0:
+            continue
+        weighted_war += weight * entry.war
+        weighted_usage += weight * usage
+        usage_total += usage
+    rate_obs = weighted_war / (weighted_usage / denom) if weighted_usage > 0 else 0.0
+    usage_obs = usage_sum / total_weight if total_weight > 0 else 0.0
+    return rate_obs, usage_total, usage_obs
 
 
 def regress_rate(rate_obs: float, n: float, rate_prior: float, k_rate: float) -> float:
@@ -101,8 +99,7 @@ def build_rate_projection(
     usage_prior: float,
     k_u: float,
 ) -> RateProjection:
-    rate_obs, n_usage = weighted_rate(history, denom)
-    usage_obs = weighted_usage(history)
+    rate_obs, n_usage, usage_obs = weighted_history(history, denom)
     rate_post = regress_rate(rate_obs, n_usage, rate_prior, k_rate)
     usage_post = regress_usage(usage_obs, n_usage, usage_prior, k_u)
     return RateProjection(
@@ -122,11 +119,10 @@ def expected_war_path(
     denom: float,
     aging: AgingCurve,
 ) -> list[float]:
-    wars: list[float] = []
-    for t in range(years):
-        age_t = age + t
-        rate_t = rate_post * aging.rate_multiplier(age_t)
-        usage_t = usage_post * aging.usage_multiplier(age_t)
-        war_t = rate_t * (usage_t / denom) if denom else 0.0
-        wars.append(war_t)
-    return wars
+    if not denom:
+        return [0.0] * years
+    rate_mults, usage_mults = aging_schedule(aging, age, years)
+    return [
+        (rate_post * rate_mult) * ((usage_post * usage_mult) / denom)
+        for rate_mult, usage_mult in zip(rate_mults, usage_mults)
+    ]
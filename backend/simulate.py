@@ -3,11 +3,12 @@ from __future__ import annotations
 import math
 import random
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable
 
 from backend.contracts import ContractYear
 from backend.durability import DurabilityMixture
-from backend.projections import AgingCurve
+from backend.projections import AgingCurve, aging_schedule
 
 
 @dataclass(frozen=True)
@@ -86,66 +87,91 @@ def apply_option_decision(
     return True, salary_m
 
 
+@lru_cache(maxsize=None)
+def discount_factors(discount_rate: float, horizon_years: int) -> tuple[float, ...]:
+    return tuple(1.0 / ((1.0 + discount_rate) ** t) for t in range(horizon_years))
+
+
 def simulate_tvp(
     config: SimulationConfig,
     inputs: SimulationInputs,
     expected_war: list[float],
 ) -> SimulationResult:
     samples: list[float] = []
+    horizon = inputs.horizon_years
+    discount_by_t = discount_factors(inputs.discount_rate, horizon)
+    rate_mult_by_t, usage_mult_by_t = aging_schedule(inputs.aging, inputs.age, horizon)
+    usage_base_by_t = [inputs.usage_post * mult for mult in usage_mult_by_t]
+    if usage_base_by_t:
+        usage_base_by_t[0] *= inputs.in_season_fraction
+    price_by_t = inputs.war_price_by_year[:horizon]
+    market_by_t = [
+        expected_war[t] * price_by_t[t] if t < len(expected_war) else 0.0 for t in range(horizon)
+    ]
+    contract_by_t = [inputs.contract_years[t] for t in range(horizon)]
+    cost_by_t = [entry.cost_m for entry in contract_by_t]
+    if cost_by_t:
+        cost_by_t[0] *= inputs.in_season_fraction
+    option_by_t = [
+        (entry.option_type, entry.option_salary_m or cost_by_t[t], entry.option_buyout_m)
+        if entry.option_type
+        else None
+        for t, entry in enumerate(contract_by_t)
+    ]
+    durability_thresholds = []
+    cumulative = 0.0
+    for state in inputs.durability.states:
+        cumulative += state.probability
+        durability_thresholds.append((cumulative, state.usage_multiplier))
+    gauss = random.gauss
+    uniform = random.random
+    rate_post = inputs.rate_post
+    talent_sd = config.talent_sd
+    year_shock_sd = config.year_shock_sd
+    role_prob_sp = inputs.role_prob_sp
+    denom = inputs.denom
     random.seed(42)
 
     for _ in range(config.sims):
-        talent_rate = random.gauss(inputs.rate_post, config.talent_sd)
-        role = select_role(inputs.role_prob_sp)
+        talent_rate = gauss(rate_post, talent_sd)
+        role = select_role(role_prob_sp)
         tvp = 0.0
         active = True
 
-        for t in range(inputs.horizon_years):
+        for t in range(horizon):
             if not active:
                 break
-            age_t = inputs.age + t
-            rate_t = talent_rate + random.gauss(0.0, config.year_shock_sd)
-            rate_t *= inputs.aging.rate_multiplier(age_t)
+            rate_t = talent_rate + gauss(0.0, year_shock_sd)
+            rate_t *= rate_mult_by_t[t]
 
-            usage_base = inputs.usage_post * inputs.aging.usage_multiplier(age_t)
-            if t == 0:
-                usage_base *= inputs.in_season_fraction
-
-            state_roll = random.random()
-            cumulative = 0.0
+            state_roll = uniform()
             usage_mult = 0.0
-            for state in inputs.durability.states:
-                cumulative += state.probability
-                if state_roll <= cumulative:
-                    usage_mult = state.usage_multiplier
+            for threshold, state_usage_mult in durability_thresholds:
+                if state_roll <= threshold:
+                    usage_mult = state_usage_mult
                     break
-            usage_t = usage_base * usage_mult
-
-            war_t = rate_t * (usage_t / inputs.denom) if inputs.denom else 0.0
+            usage_t = usage_base_by_t[t] * usage_mult
 
-            price_t = inputs.war_price_by_year[t]
-            value_t = war_t * price_t
-            market_t = expected_war[t] * price_t if t < len(expected_war) else 0.0
+            war_t = rate_t * (usage_t / denom) if denom else 0.0
 
-            cost_entry = inputs.contract_years[t]
-            cost_t = cost_entry.cost_m
-            if t == 0:
-                cost_t *= inputs.in_season_fraction
+            value_t = war_t * price_by_t[t]
+            cost_t = cost_by_t[t]
 
-            if cost_entry.option_type:
+            option = option_by_t[t]
+            if option is not None:
+                option_type, option_salary, option_buyout = option
                 exercised, cost_t = apply_option_decision(
-                    cost_entry.option_type,
+                    option_type,
                     value_t,
-                    cost_entry.option_salary_m or cost_t,
-                    cost_entry.option_buyout_m,
-                    market_t,
+                    option_salary,
+                    option_buyout,
+                    market_by_t[t],
                 )
                 if not exercised:
                     active = False
 
             surplus_t = value_t - cost_t
-            disc = 1.0 / ((1.0 + inputs.discount_rate) ** t)
-            tvp += surplus_t * disc
+            tvp += surplus_t * discount_by_t[t]
 
         samples.append(tvp)
 
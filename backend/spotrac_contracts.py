@@ -8,16 +8,23 @@ import random
 import re
 import sqlite3
 import time
+import unicodedata
 import urllib.error
 import urllib.request
 import urllib.parse
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
 from bs4 import BeautifulSoup, Comment
 
+try:
+    from .data_utils import read_json
+except ImportError:  # pragma: no cover - script execution fallback
+    from data_utils import read_json
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DB_PATH = Path(__file__).with_name("stats.db")
 ID_MAP_PATH = REPO_ROOT / "data" / "mlb_api" / "id_map_mlbam_to_idfg.json"
@@ -123,8 +130,7 @@ def parse_option_type(raw: str | None) -> Optional[str]:
 def load_player_positions_map(path: Path) -> dict[int, dict[str, Optional[str]]]:
     if not path.exists():
         return {}
-    with path.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
+    data = read_json(path)
     positions: dict[int, dict[str, Optional[str]]] = {}
     if not isinstance(data, dict):
         return positions
@@ -163,14 +169,58 @@ class PlayerIndexEntry:
             return None
         return round(sum(values), 3)
 
+    @cached_property
+    def name_key(self) -> str:
+        return normalize_name(self.name)
+
+    @property
+    def name_team_key(self) -> tuple[str, str]:
+        return (self.name_key, self.team.lower())
+
+
+NAME_PAREN_RE = re.compile(r"\(.*?\)")
+NAME_SUFFIX_RE = re.compile(r"\b(jr|sr|ii|iii|iv|v)\b", re.IGNORECASE)
+NON_ALPHA_RE = re.compile(r"[^a-zA-Z\s]")
+WHITESPACE_RE = re.compile(r"\s+")
+ASCII_NON_ALPHA_TABLE = str.maketrans(
+    {chr(code): " " for code in range(128) if not (chr(code).isalpha() or chr(code).isspace())}
+)
+
+COMBINING_MARK_RANGES = (
+    (0x0300, 0x036F),
+    (0x1AB0, 0x1AFF),
+    (0x1DC0, 0x1DFF),
+    (0x20D0, 0x20FF),
+    (0xFE20, 0xFE2F),
+)
+COMBINING_MARKS_TABLE = {
+    code: None
+    for start, end in COMBINING_MARK_RANGES
+    for code in range(start, end + 1)
+    if unicodedata.combining(chr(code))
+}
+
+
+def strip_accents(text: str) -> str:
+    if text.isascii():
+        return text
+    stripped = unicodedata.normalize("NFKD", text).translate(COMBINING_MARKS_TABLE)
+    if stripped.isascii():
+        return stripped
+    return "".join(ch for ch in stripped if not unicodedata.combining(ch))
 
+
+@lru_cache(maxsize=65536)
 def normalize_name(name: str) -> str:
-    name = re.sub(r"\(.*?\)", "", name)
+    name = strip_accents(name)
+    name = NAME_PAREN_RE.sub("", name)
     name = name.replace(".", " ")
-    name = re.sub(r"\b(jr|sr|ii|iii|iv|v)\b", "", name, flags=re.IGNORECASE)
-    name = re.sub(r"[^a-zA-Z\s]", " ", name)
-    name = re.sub(r"\s+", " ", name).strip().lower()
-    return name
+    name = NAME_SUFFIX_RE.sub("", name)
+    if name.isascii():
+        name = name.translate(ASCII_NON_ALPHA_TABLE)
+    else:
+        name = NON_ALPHA_RE.sub(" ", name)
+    return " ".join(name.split()).lower()
 
 
 def parse_money_to_m(value: str | None) -> Optional[float]:
@@ -226,8 +276,8 @@ def parse_int_value(value: object) -> Optional[int]:
 
 
 def normalize_team_name(name: str) -> str:
-    cleaned = re.sub(r"[^a-zA-Z\s]", " ", name)
-    return re.sub(r"\s+", " ", cleaned).strip().lower()
+    cleaned = NON_ALPHA_RE.sub(" ", name)
+    return WHITESPACE_RE.sub(" ", cleaned).strip().lower()
 
 
 def normalize_short_year(value: str) -> Optional[int]:
@@ -244,8 +294,18 @@ def normalize_short_year(value: str) -> Optional[int]:
     return year
 
 
+YEAR_RANGE_RE = re.compile(r"(\d{2,4})\s*-\s*(\d{2,4})")
+CONTRACT_YEARS_RE = re.compile(r"(\d+)\s*year", re.IGNORECASE)
+MONEY_RE = re.compile(r"\$[\d,.]+[MKmk]?")
+CONTRACT_SPAN_RE = re.compile(r"\((\d{4})(?:-(\d{2,4}))?\)")
+CALENDAR_YEAR_RE = re.compile(r"\b(20\d{2})\b")
+OPTION_YEAR_RE = re.compile(r"(\d{4})\s+option", re.IGNORECASE)
+
+
 def parse_year_range(text: str) -> tuple[Optional[int], Optional[int]]:
-    match = re.search(r"(\d{2,4})\s*-\s*(\d{2,4})", text)
+    if "-" not in text:
+        return None, None
+    match = YEAR_RANGE_RE.search(text)
     if not match:
         return None, None
     start = normalize_short_year(match.group(1))
@@ -256,14 +316,14 @@ def parse_year_range(text: str) -> tuple[Optional[int], Optional[int]]:
 def parse_contract_summary(
     summary: str,
 ) -> tuple[Optional[int], Optional[float], Optional[int], Optional[int], set[int]]:
-    years_match = re.search(r"(\d+)\s*year", summary, re.IGNORECASE)
+    years_match = CONTRACT_YEARS_RE.search(summary) if "year" in summary.lower() else None
     years = int(years_match.group(1)) if years_match else None
-    value_match = re.search(r"\$[\d,.]+[MKmk]?", summary)
+    value_match = MONEY_RE.search(summary) if "$" in summary else None
     total_value_m = parse_money_to_m(value_match.group(0)) if value_match else None
 
     start_year = None
     end_year = None
-    range_match = re.search(r"\((\d{4})(?:-(\d{2,4}))?\)", summary)
+    range_match = CONTRACT_SPAN_RE.search(summary) if "(" in summary else None
     if range_match:
         start_year = normalize_short_year(range_match.group(1))
         if range_match.group(2):
@@ -271,13 +331,13 @@ def parse_contract_summary(
         else:
             end_year = start_year
     else:
-        year_match = re.search(r"\b(20\d{2})\b", summary)
+        year_match = CALENDAR_YEAR_RE.search(summary)
         if year_match:
             start_year = int(year_match.group(1))
             end_year = start_year
 
     option_years: set[int] = set()
-    for match in re.finditer(r"(\d{4})\s+option", summary, re.IGNORECASE):
+    for match in OPTION_YEAR_RE.finditer(summary):
         option_years.add(int(match.group(1)))
 
     if years and start_year and end_year is None:
@@ -1431,7 +1491,7 @@ def apply_mlb_ids(
         entry.mlb_id = fg_to_mlb.get(entry.player_id)
         if entry.mlb_id:
             continue
-        candidates = chadwick_names.get(normalize_name(entry.name), [])
+        candidates = chadwick_names.get(entry.name_key, [])
         best, reason = select_chadwick_candidate(candidates)
         if best and best.get("mlb_id"):
             entry.mlb_id = best["mlb_id"]
@@ -1451,7 +1511,7 @@ def build_matching_indexes(index: dict[int, PlayerIndexEntry]):
     by_name: dict[str, list[PlayerIndexEntry]] = {}
 
     for entry in index.values():
-        name_key = normalize_name(entry.name)
+        name_key = entry.name_key
         by_team.setdefault(entry.team, {})[name_key] = entry
         by_name.setdefault(name_key, []).append(entry)
 
@@ -1640,7 +1700,7 @@ def build_contract_outputs():
     for entry in player_index.values():
         if entry.mlb_id and entry.mlb_id in contracts_by_mlb_id:
             continue
-        fallback_key = (normalize_name(entry.name), entry.team.lower())
+        fallback_key = entry.name_team_key
         if fallback_key in contracts_by_name_team:
             continue
         missing_entries.append(entry)
@@ -1658,7 +1718,7 @@ def build_contract_outputs():
         if entry.mlb_id:
             bbref_id = mlb_to_bbref.get(entry.mlb_id)
         if not bbref_id:
-            candidates = chadwick_names.get(normalize_name(entry.name), [])
+            candidates = chadwick_names.get(entry.name_key, [])
             best, _ = select_chadwick_candidate(candidates)
             if best:
                 bbref_id = best.get("bbref_id")
@@ -1674,9 +1734,7 @@ def build_contract_outputs():
             if entry.mlb_id:
                 contracts_by_mlb_id.setdefault(entry.mlb_id, contract)
                 bref_added += 1
-            contracts_by_name_team[(normalize_name(entry.name), entry.team.lower())] = (
-                contract
-            )
+            contracts_by_name_team[entry.name_team_key] = contract
             bref_reused += 1
             continue
 
@@ -1736,9 +1794,7 @@ def build_contract_outputs():
         if entry.mlb_id:
             contracts_by_mlb_id.setdefault(entry.mlb_id, contract)
             bref_added += 1
-        contracts_by_name_team[(normalize_name(entry.name), entry.team.lower())] = (
-            contract
-        )
+        contracts_by_name_team[entry.name_team_key] = contract
         if idx == 1 or idx % 25 == 0 or idx == total_missing:
             print(
                 "BRef: "
@@ -1756,7 +1812,7 @@ def build_contract_outputs():
     for entry in missing_entries:
         if entry.mlb_id and entry.mlb_id in contracts_by_mlb_id:
             continue
-        fallback_key = (normalize_name(entry.name), entry.team.lower())
+        fallback_key = entry.name_team_key
         if fallback_key in contracts_by_name_team:
             continue
         remaining_entries.append(entry)
@@ -1765,7 +1821,7 @@ def build_contract_outputs():
     if remaining_entries:
         print(f"Spotrac search: processing {len(remaining_entries)} players")
     for idx, entry in enumerate(remaining_entries, start=1):
-        name_key = normalize_name(entry.name)
+        name_key = entry.name_key
         if not name_key:
             continue
         search_query = urllib.parse.quote_plus(entry.name)
@@ -1827,9 +1883,7 @@ def build_contract_outputs():
         if entry.mlb_id:
             contracts_by_mlb_id.setdefault(entry.mlb_id, contract)
             spotrac_search_added += 1
-        contracts_by_name_team[(normalize_name(entry.name), entry.team.lower())] = (
-            contract
-        )
+        contracts_by_name_team[entry.name_team_key] = contract
 
         if idx == 1 or idx % 25 == 0 or idx == len(remaining_entries):
             print(
@@ -1843,7 +1897,7 @@ def build_contract_outputs():
     for entry in remaining_entries:
         if entry.mlb_id and entry.mlb_id in contracts_by_mlb_id:
             continue
-        fallback_key = (normalize_name(entry.name), entry.team.lower())
+        fallback_key = entry.name_team_key
         if fallback_key in contracts_by_name_team:
             continue
         final_missing.append(entry)
@@ -1889,9 +1943,7 @@ def build_contract_outputs():
         }
 
         contracts_by_mlb_id.setdefault(entry.mlb_id, contract)
-        contracts_by_name_team[(normalize_name(entry.name), entry.team.lower())] = (
-            contract
-        )
+        contracts_by_name_team[entry.name_team_key] = contract
         derived_added += 1
 
     if derived_added:
@@ -2014,7 +2066,7 @@ def build_contract_outputs():
         if entry.mlb_id and entry.mlb_id in contracts_by_mlb_id:
             contract = contracts_by_mlb_id[entry.mlb_id]
         else:
-            fallback_key = (normalize_name(entry.name), entry.team.lower())
+            fallback_key = entry.name_team_key
             contract = contracts_by_name_team.get(fallback_key)
         if not contract:
             players_payload["missing_contracts"].append(
@@ -1,4 +1,6 @@
 import json
+import os
+import sqlite3
 from dataclasses import replace
 from datetime import date
 from pathlib import Path
@@ -7,16 +9,19 @@ import pytest
 
 from backend.contracts import build_contract_schedule
 from backend.service_time import ControlTimeline
+from backend.data_utils import dumps_json
 from backend.output import PlayerOutput, emit_outputs, build_breakdown, emit_ranked_outputs
-from backend.projections import SeasonHistory, build_rate_projection
+from backend.projections import SeasonHistory, build_rate_projection, expected_war_path
 from backend.service_time import ServiceTimeRecord, SeasonWindow, compute_super_two, super_two_for_snapshot
 from backend.simulate import SimulationConfig, SimulationInputs, apply_option_decision, compute_quantiles, simulate_tvp
 from backend.durability import DurabilityState, DurabilityMixture
+from backend.tvp_engine import load_config as load_tvp_config, position_tokens
 from backend.projections import AgingCurve
 from backend.contracts import ContractYear
 from backend.compute_mlb_tvp import (
     is_player_eligible,
     total_usage,
+    summarize_usage,
     usage_prior_for_player,
     load_config,
     seasons_with_usage,
@@ -24,6 +29,7 @@ from backend.compute_mlb_tvp import (
     should_use_aav_for_deferrals,
     resolve_projection_role,
     determine_role,
+    sp_prob_by_age,
     build_player_output,
     leaderboard_eligible,
     risk_adjusted_value,
@@ -31,6 +37,15 @@ from backend.compute_mlb_tvp import (
     late_negative_surplus_years,
     backloaded_contract,
     is_prospect_like,
+    load_service_time,
+    coverage_ok,
+    open_stats_db,
+    load_positions_map,
+    project_player,
+    leaderboard_partition,
+    build_player_outputs,
+    PARALLEL_MIN_PLAYERS,
+    projected_war_next_year,
 )
 
 
@@ -304,18 +319,18 @@ def test_discounting_year_indexing():
 
 
 def test_player_eligibility_filter():
-    assert is_player_eligible(None, {}) is False
+    assert is_player_eligible(None, summarize_usage({})) is False
     record = ServiceTimeRecord(mlbam_id=1, service_time_years=1, service_time_days=0)
-    assert is_player_eligible(record, {}) is True
-    assert is_player_eligible(None, {2025: {"pa": 10.0}}) is True
+    assert is_player_eligible(record, summarize_usage({})) is True
+    assert is_player_eligible(None, summarize_usage({2025: {"pa": 10.0}})) is True
 
 
 def test_prior_degrades_for_no_usage():
     config = load_config(Path("backend/tvp_config.json"), "bWAR")
     usage = {2025: {"pa": 0.0}}
-    assert usage_prior_for_player("H", usage, config) == config.usage_prior.get("bench", 150.0)
+    assert usage_prior_for_player("H", summarize_usage(usage), config) == config.usage_prior.get("bench", 150.0)
     usage = {2025: {"ip": 0.0}}
-    assert usage_prior_for_player("SP", usage, config) == config.usage_prior.get("rp", 60.0)
+    assert usage_prior_for_player("SP", summarize_usage(usage), config) == config.usage_prior.get("rp", 60.0)
 
 
 def test_seasons_with_usage_counts():
@@ -436,21 +451,21 @@ def test_deferral_aav_policy_detects_large_gap():
 def test_hybrid_projection_role_defaults_to_config():
     config = load_config(Path("backend/tvp_config.json"), "bWAR")
     config = replace(config, hybrid_default_role="H")
-    role = resolve_projection_role("HYB", {2025: {"pa": 10.0, "ip": 10.0}}, None, config)
+    role = resolve_projection_role("HYB", summarize_usage({2025: {"pa": 10.0, "ip": 10.0}}), None, config)
     assert role == "H"
 
 
 def test_role_classification_ignores_trivial_pitcher_pa():
     config = load_config(Path("backend/tvp_config.json"), "bWAR")
     usage = {2025: {"ip": 55.0, "pa": 5.0, "g": 20.0, "gs": 20.0}}
-    role, _ = determine_role(usage, config)
+    role, _ = determine_role(summarize_usage(usage), config)
     assert role == "SP"
 
 
 def test_role_classification_true_two_way():
     config = load_config(Path("backend/tvp_config.json"), "bWAR")
     usage = {2025: {"ip": 50.0, "pa": 300.0, "g": 20.0, "gs": 20.0}}
-    role, _ = determine_role(usage, config)
+    role, _ = determine_role(summarize_usage(usage), config)
     assert role == "HYB"
 
 
@@ -538,14 +553,14 @@ def test_verified_extension_uses_contract():
 def test_leaderboard_eligibility_thresholds():
     config = load_config(Path("backend/tvp_config.json"), "bWAR")
     service = ServiceTimeRecord(mlbam_id=1, service_time_years=0, service_time_days=0)
-    assert leaderboard_eligible("H", {2025: {"pa": 199.0}}, service, config) is False
-    assert leaderboard_eligible("H", {2025: {"pa": 200.0}}, service, config) is True
-    assert leaderboard_eligible("SP", {2025: {"ip": 49.9}}, service, config) is False
-    assert leaderboard_eligible("SP", {2025: {"ip": 50.0}}, service, config) is True
+    assert leaderboard_eligible("H", summarize_usage({2025: {"pa": 199.0}}), service, config) is False
+    assert leaderboard_eligible("H", summarize_usage({2025: {"pa": 200.0}}), service, config) is True
+    assert leaderboard_eligible("SP", summarize_usage({2025: {"ip": 49.9}}), service, config) is False
+    assert leaderboard_eligible("SP", summarize_usage({2025: {"ip": 50.0}}), service, config) is True
     service_full = ServiceTimeRecord(mlbam_id=2, service_time_years=0, service_time_days=0)
-    assert leaderboard_eligible("H", {}, service_full, replace(config, leaderboard_min_service_days=172)) is False
+    assert leaderboard_eligible("H", summarize_usage({}), service_full, replace(config, leaderboard_min_service_days=172)) is False
     service_full = ServiceTimeRecord(mlbam_id=2, service_time_years=0, service_time_days=172)
-    assert leaderboard_eligible("H", {}, service_full, config) is True
+    assert leaderboard_eligible("H", summarize_usage({}), service_full, config) is True
 
 
 def test_pitcher_std_exceeds_hitter_std_with_higher_shock_and_tails():
@@ -778,3 +793,275 @@ def test_metrics_use_career_with_recent_weight():
     assert output is not None
     expected = (200 * 600 + 100 * 600 + 100 * 600 + 100 * 600 * 2) / (600 + 600 + 600 + 600 * 2)
     assert output.ops_plus_career_weighted == pytest.approx(expected)
+
+
+def test_load_service_time_skips_null_ids():
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE service_time_bref (mlbam_id INTEGER, service_time_years INTEGER, "
+        "service_time_days INTEGER, service_time_label TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO service_time_bref VALUES (?, ?, ?, ?)",
+        [(1, 3, 45, "3.045"), (None, 1, 0, "1.000"), (2, None, None, None)],
+    )
+    records = load_service_time(conn)
+    conn.close()
+    assert set(records) == {1, 2}
+    assert records[1].total_service_days == 3 * 172 + 45
+    assert records[2].service_time_years == 0
+    assert records[2].service_time_label is None
+
+
+def test_load_service_time_missing_table():
+    conn = sqlite3.connect(":memory:")
+    assert load_service_time(conn) == {}
+    conn.close()
+
+
+def test_coverage_ok_requires_both_tables():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE batting_stats (season INTEGER)")
+    conn.execute("CREATE TABLE pitching_stats (season INTEGER)")
+    conn.executemany("INSERT INTO batting_stats VALUES (?)", [(2024,), (2025,), (None,)])
+    conn.executemany("INSERT INTO pitching_stats VALUES (?)", [(2025,)])
+    assert coverage_ok(conn, [2025])
+    assert not coverage_ok(conn, [2024, 2025])
+    conn.close()
+
+
+def test_position_tokens_split_on_whitespace_and_separators():
+    assert position_tokens("OF, 1B") == ["OF", "1B"]
+    assert position_tokens("ss/2b") == ["SS", "2B"]
+    assert position_tokens("C-1B") == ["C", "1B"]
+    assert position_tokens(None) == []
+
+
+def test_tvp_load_config_reparses_on_change(tmp_path):
+    data = json.loads(Path("backend/tvp_config.json").read_text(encoding="utf-8"))
+    path = tmp_path / "tvp_config.json"
+    path.write_text(json.dumps({**data, "snapshot_year": 2025}), encoding="utf-8")
+    first = load_tvp_config(path)
+    assert load_tvp_config(path) is first
+    path.write_text(json.dumps({**data, "snapshot_year": 2026}), encoding="utf-8")
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+    assert load_tvp_config(path).snapshot_year == 2026
+
+
+def test_projection_setup_runs_once_per_output(monkeypatch):
+    import backend.compute_mlb_tvp as mlb
+
+    config = load_config(Path("backend/tvp_config.json"), "bWAR")
+    player = {
+        "mlbam_id": 321,
+        "name": "Hitter",
+        "team": "TST",
+        "age": 27,
+        "contract": {},
+        "war": {"war_2023": 2.0, "war_2024": float("nan"), "war_2025": 3.0},
+        "usage": {2023: {"pa": 550.0}, 2025: {"pa": 600.0}},
+        "role": "H",
+        "gs_share": None,
+        "service_time": ServiceTimeRecord(mlbam_id=321, service_time_years=3, service_time_days=0),
+        "position": "SS",
+    }
+    calls = []
+    monkeypatch.setattr(
+        mlb, "project_player", lambda *args: calls.append(args) or project_player(*args)
+    )
+    assert build_player_output(player, config, 2026, 1.0, set()) is not None
+    assert len(calls) == 1
+
+    projected = project_player(player, config, 2026)
+    assert projected.role == "H" and projected.denom == 600.0
+    assert [row.war for row in projected.history] == [2.0, 0.0, 3.0]
+    expected = expected_war_path(
+        projected.projection.rate_post,
+        projected.projection.usage_post,
+        27,
+        1,
+        projected.denom,
+        projected.aging,
+    )
+    assert projected_war_next_year(player, config, 2026) == ("H", expected[0])
+
+
+def test_leaderboard_partition_single_pass():
+    base = PlayerOutput(
+        mlbam_id=0,
+        name="Base",
+        team="TST",
+        age=25,
+        role="H",
+        position="SS",
+        status_t=[],
+        tvp=0.0,
+        tvp_p10=0.0,
+        tvp_p50=0.0,
+        tvp_p90=0.0,
+        talent_value_p50=None,
+        tvp_mean=None,
+        tvp_std=None,
+        tvp_risk_adj=None,
+        flags={},
+        breakdown=[],
+        service_time=None,
+    )
+    ranked = [
+        replace(base, mlbam_id=1, flags={"leaderboard_eligible": True}),
+        replace(base, mlbam_id=2, flags={"leaderboard_eligible": False}),
+        replace(base, mlbam_id=3, flags={"small_sample": True}),
+        replace(base, mlbam_id=4, flags={}),
+    ]
+    pool, eligible = leaderboard_partition(ranked, include_small_sample=False)
+    assert [o.mlbam_id for o in pool] == [1, 3, 4]
+    assert [o.mlbam_id for o in eligible] == [1, 4]
+    _, eligible = leaderboard_partition(ranked, include_small_sample=True)
+    assert [o.mlbam_id for o in eligible] == [1, 3, 4]
+
+
+def test_contract_overrides_copy_only_on_write():
+    config = load_config(Path("backend/tvp_config.json"), "bWAR")
+    config = replace(config, contract_overrides={}, contract_cost_basis="aav_for_deferrals")
+    contract = {
+        "contract_years": [{"season": 2026, "salary_m": 20.0}],
+        "aav_m": 20.0,
+        "years_remaining": 1,
+    }
+    adjusted, basis = apply_contract_overrides(contract, 1, 2026, config)
+    assert adjusted is contract and basis is None
+
+    deferred = {
+        "contract_years": [{"season": 2026, "salary_m": 2.0}, {"season": 2027, "salary_m": 2.0}],
+        "aav_m": 10.0,
+        "years_remaining": 2,
+    }
+    adjusted, basis = apply_contract_overrides(deferred, 1, 2026, config)
+    assert basis == "aav"
+    assert adjusted is not deferred
+    assert deferred["contract_years"][0]["salary_m"] == 2.0
+    assert "cost_basis_override" not in deferred
+
+
+def test_build_player_outputs_parallel_matches_serial():
+    config = load_config(Path("backend/tvp_config.json"), "bWAR")
+    players = [
+        {
+            "mlbam_id": mlbam_id,
+            "name": f"Player {mlbam_id}",
+            "team": "TST",
+            "age": 24 + mlbam_id % 10,
+            "contract": {},
+            "war": {"war_2023": 1.0, "war_2024": 2.0, "war_2025": 1.5 * mlbam_id},
+            "usage": {2024: {"pa": 400.0}, 2025: {"pa": 550.0}},
+            "role": "H",
+            "gs_share": None,
+            "service_time": ServiceTimeRecord(mlbam_id=mlbam_id, service_time_years=2, service_time_days=0),
+            "position": "2B",
+        }
+        for mlbam_id in range(1, PARALLEL_MIN_PLAYERS + 1)
+    ]
+    players.append({**players[0], "mlbam_id": 99, "age": None})
+    serial = build_player_outputs(players, config, 2026, 1.0, set())
+    parallel = build_player_outputs(players, config, 2026, 1.0, set(), workers=2)
+    assert [o.mlbam_id for o in serial] == list(range(1, PARALLEL_MIN_PLAYERS + 1))
+    assert parallel == serial
+
+
+def test_emit_outputs_streams_indented_json(tmp_path: Path):
+    player = PlayerOutput(
+        mlbam_id=1,
+        name="Peña",
+        team="TST",
+        age=25,
+        role="H",
+        position="SS",
+        status_t=["contract", "arb1"],
+        tvp=1.75,
+        tvp_p10=1.0,
+        tvp_p50=2.0,
+        tvp_p90=3.0,
+        talent_value_p50=2.5,
+        tvp_mean=2.0,
+        tvp_std=0.5,
+        tvp_risk_adj=1.75,
+        flags={"small_sample": False},
+        breakdown=[{"season": 2026, "war": 1.5}],
+        service_time="01/2026",
+        components={"bat": 1e-7},
+    )
+    for results in ([], [player, replace(player, mlbam_id=2, breakdown=[])]):
+        json_path, _ = emit_outputs(tmp_path, "2026-01-01", "bWAR", results, 2, meta_extra={"p0": {"n": 1}})
+        text = Path(json_path).read_text(encoding="utf-8")
+        assert text == dumps_json(json.loads(text), indent=True)
+        assert len(json.loads(text)["players"]) == len(results)
+    assert '"name": "Peña"' in text
+    assert '"bat": 1e-7' in text
+
+
+def test_load_config_cached_per_file_and_war_source(tmp_path):
+    data = json.loads(Path("backend/tvp_config.json").read_text())
+    data["mlb_v1"]["war_sources"]["fWAR"] = data["mlb_v1"]["war_sources"]["bWAR"]
+    path = tmp_path / "tvp_config.json"
+    path.write_text(json.dumps(data))
+    first = load_config(path, "bWAR")
+    assert load_config(path, "bWAR") is first
+    assert load_config(path, "fWAR") is not first
+    data["mlb_v1"]["simulations"] = first.simulations + 1
+    path.write_text(json.dumps(data))
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+    assert load_config(path, "bWAR").simulations == first.simulations + 1
+
+
+def test_open_stats_db_is_read_only(tmp_path):
+    db_path = tmp_path / "stats db.sqlite"
+    with sqlite3.connect(db_path) as setup:
+        setup.execute("CREATE TABLE service_time (mlbam_id INTEGER)")
+    conn = open_stats_db(db_path)
+    assert conn.execute("SELECT COUNT(*) FROM service_time").fetchone() == (0,)
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute("INSERT INTO service_time VALUES (1)")
+    conn.close()
+    assert open_stats_db(tmp_path / "missing.db") is None
+
+
+def test_summarize_usage_totals_all_columns():
+    summary = summarize_usage(
+        {2024: {"pa": 20.0, "ip": 60.0, "g": 12.0, "gs": 9.0}, 2025: {"ip": 40.0, "g": 8.0, "gs": 1.0}}
+    )
+    assert (summary.pa, summary.ip, summary.g, summary.gs) == (20.0, 100.0, 20.0, 10.0)
+    assert summary.gs_share == 0.5
+    assert summarize_usage({}).gs_share == 0.0
+    assert total_usage({2025: {"pa": 5.0}}) == (5.0, 0.0)
+
+
+def test_sp_prob_by_age_steps_through_sorted_ages():
+    ages, values = (23, 27, 31), (0.8, 0.6, 1.4)
+    assert sp_prob_by_age(20, ages, values) == 0.8
+    assert sp_prob_by_age(27, ages, values) == 0.6
+    assert sp_prob_by_age(30, ages, values) == 0.6
+    assert sp_prob_by_age(35, ages, values) == 1.0
+    assert sp_prob_by_age(30, (), ()) == 0.5
+
+
+def test_load_positions_map_cached_until_file_changes(tmp_path):
+    path = tmp_path / "positions.json"
+    path.write_text(json.dumps({"1": {"position": "SS"}, "2": "C", "x": "1B"}))
+    first = load_positions_map(path)
+    assert first == {1: "SS", 2: "C"}
+    assert load_positions_map(path) is first
+    path.write_text(json.dumps({"1": "2B"}))
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+    assert load_positions_map(path) == {1: "2B"}
+    assert load_positions_map(tmp_path / "missing.json") == {}
+
+
+def test_load_config_fills_role_parameter_fallbacks(tmp_path):
+    data = json.loads(Path("backend/tvp_config.json").read_text())
+    data["mlb_v1"]["k_rate"] = {"SP": 150}
+    data["mlb_v1"]["rate_prior"] = {}
+    path = tmp_path / "tvp_config.json"
+    path.write_text(json.dumps(data))
+    config = load_config(path, "bWAR")
+    assert config.k_rate == {"SP": 150.0, "RP": 150.0, "H": 600.0}
+    assert config.rate_prior == {"SP": 2.5, "RP": 2.5, "H": 2.0}
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from math import exp
 from pathlib import Path
 import json
@@ -77,12 +78,18 @@ class TvpConfig:
         )
 
 
+@lru_cache(maxsize=4)
+def _load_config_cached(path: str, mtime_ns: int) -> TvpConfig:
+    with open(path, "r", encoding="utf-8") as handle:
+        data = json.load(handle)
+    return TvpConfig.from_dict(data)
+
+
 def load_config(path: Path | None = None) -> TvpConfig:
     if path is None:
         path = Path(__file__).with_name("tvp_config.json")
-    with path.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
-    return TvpConfig.from_dict(data)
+    path = Path(path)
+    return _load_config_cached(str(path.resolve()), path.stat().st_mtime_ns)
 
 
 def discount_factor(t: int, discount_rate: float) -> float:
@@ -93,17 +100,31 @@ def war_price(config: TvpConfig, t: int) -> float:
     return config.dollars_per_war * ((1.0 + config.war_price_growth) ** t)
 
 
+@lru_cache(maxsize=None)
+def min_salary_curve(min_salary_m: float, growth: float, years: int) -> tuple[float, ...]:
+    return tuple(min_salary_m * ((1.0 + growth) ** t) for t in range(years))
+
+
 def sigmoid(x: float) -> float:
     return 1.0 / (1.0 + exp(-x))
 
 
+DIGITS_RE = re.compile(r"\d+")
+YEAR_RE = re.compile(r"\d{4}")
+
+
+@lru_cache(maxsize=256)
+def _first_int(text: str, year_only: bool = False) -> int | None:
+    match = (YEAR_RE if year_only else DIGITS_RE).search(text)
+    return int(match.group()) if match else None
+
+
 def parse_fv_value(raw: Any) -> int | None:
     if raw is None:
         return None
     if isinstance(raw, (int, float)):
         return int(raw)
-    digits = re.findall(r"\d+", str(raw))
-    return int(digits[0]) if digits else None
+    return _first_int(str(raw))
 
 
 def parse_eta_year(raw: Any, snapshot_year: int) -> int:
@@ -111,11 +132,12 @@ def parse_eta_year(raw: Any, snapshot_year: int) -> int:
         return snapshot_year
     if isinstance(raw, (int, float)):
         return int(raw)
-    digits = re.findall(r"\d{4}", str(raw))
-    if digits:
-        return int(digits[0])
-    digits = re.findall(r"\d+", str(raw))
-    return int(digits[0]) if digits else snapshot_year
+    text = str(raw)
+    year = _first_int(text, True)
+    if year is not None:
+        return year
+    digits = _first_int(text)
+    return digits if digits is not None else snapshot_year
 
 
 def top100_multiplier(rank: int | None, config: TvpConfig) -> float:
@@ -132,10 +154,13 @@ def is_pitcher_position(position: str | None) -> bool:
     return any(token in {"SP", "RP", "P", "RHP", "LHP"} for token in tokens)
 
 
+POSITION_SPLIT_RE = re.compile(r"[\s,/\-]+")
+
+
 def position_tokens(position: str | None) -> list[str]:
     if not position:
         return []
-    raw = re.split(r"[\\s,/\\-]+", position.upper())
+    raw = POSITION_SPLIT_RE.split(position.upper())
     return [token for token in raw if token]
 
 
@@ -167,10 +192,7 @@ def compute_prospect_tvp(prospect: dict[str, Any], config: TvpConfig) -> dict[st
         if pitcher and config.pitcher_profile_weights
         else config.war_profile_weights
     )
-    war_base = [war6_base * weight for weight in weights]
-
     top100_mult = top100_multiplier(prospect.get("top_100_rank"), config)
-    war_adj = [war * top100_mult for war in war_base]
 
     prob_row = config.fv_probabilities.get(fv_value)
     if not prob_row:
@@ -192,27 +214,27 @@ def compute_prospect_tvp(prospect: dict[str, Any], config: TvpConfig) -> dict[st
     p_role = remaining * (p_role / prior_remaining)
     p_star = remaining * (p_star / prior_remaining)
 
-    war_expected = []
-    for war in war_adj:
-        expected = (p_role * config.role_mult + p_star * config.star_mult) * war
-        war_expected.append(expected)
-
+    outcome_mult = p_role * config.role_mult + p_star * config.star_mult
     pos_mult = position_multiplier(prospect.get("position"), config)
-    war_expected = [war * pos_mult for war in war_expected]
+    war_expected = [
+        (outcome_mult * ((war6_base * weight) * top100_mult)) * pos_mult
+        for weight in weights
+    ]
 
-    fwar_by_year = []
-    price_by_year = []
     value_by_year = []
     salary_by_year = []
     surplus_by_year = []
     discount_factors = []
     pv_surplus_by_year = []
 
+    min_salary_by_t = min_salary_curve(
+        config.min_salary_m, config.min_salary_growth, years_to_mlb + len(war_expected)
+    )
     for idx, war in enumerate(war_expected, start=1):
         t = years_to_mlb + (idx - 1)
         price = war_price(config, t)
         value = war * price
-        salary_min = config.min_salary_m * ((1.0 + config.min_salary_growth) ** t)
+        salary_min = min_salary_by_t[t]
         arb_share = (
             config.arb_share[idx - 1] if idx - 1 < len(config.arb_share) else 0.0
         )
@@ -297,16 +319,20 @@ def compute_mlb_tvp(
     discount_factors = []
     pv_surplus_by_year = []
 
-    for t, war in enumerate(fwar):
-        price = war_price(config, t)
+    dollars_per_war = config.dollars_per_war
+    price_growth = 1.0 + config.war_price_growth
+    discount_base = 1.0 + config.discount_rate
+    for t, (war, salary_in, retained, sent) in enumerate(
+        zip(fwar, salary, salary_retained, cash_sent)
+    ):
+        price = dollars_per_war * (price_growth**t)
         value = war * price
-        salary_t = salary[t] - salary_retained[t] + cash_sent[t]
-        if current_year_fraction is not None and t == 0:
+        salary_t = salary_in - retained + sent
+        if t == 0 and current_year_fraction is not None:
             value *= current_year_fraction
             salary_t *= current_year_fraction
         surplus = value - salary_t
-        disc = discount_factor(t, config.discount_rate)
-        pv = surplus * disc
+        disc = 1.0 / (discount_base**t)
 
         fwar_by_year.append(war)
         price_by_year.append(price)
@@ -314,7 +340,7 @@ def compute_mlb_tvp(
         salary_by_year.append(salary_t)
         surplus_by_year.append(surplus)
         discount_factors.append(disc)
-        pv_surplus_by_year.append(pv)
+        pv_surplus_by_year.append(surplus * disc)
 
     option_details = []
     option_total = 0.0
@@ -595,7 +621,5 @@ def _prospect_error_result(
     }
 
 
-def _now_timestamp() -> str:
-    return (
-        datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
-    )
+def _now_timestamp(_now=datetime.now, _utc=timezone.utc) -> str:
+    return _now(_utc).isoformat(timespec="seconds").replace("+00:00", "Z")